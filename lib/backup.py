@@ -4,15 +4,289 @@ Backup management for the Minecraft server wrapper.
 Handles creating, listing, restoring, and pruning backups.
 """
 
+import itertools
+import os
+import queue
+import re
 import shutil
+import sys
+import threading
+import time
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from .utils import get_logger, get_backup_timestamp, format_size, Colors
 
+# libdeflate is optional - roughly twice as fast as zlib at the same ratio
+try:
+    import deflate as _libdeflate
+except ImportError:
+    _libdeflate = None
+
+
+def deflate_raw(data: bytes, level: int) -> bytes:
+    """
+    Compress data into a raw deflate stream (no zlib header), as stored in zip entries.
+
+    Uses libdeflate when the optional `deflate` package is installed,
+    otherwise falls back to the stdlib zlib module.
+    """
+    if _libdeflate is not None:
+        return _libdeflate.deflate_compress(data, level)
+
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+# Files that are already compressed gain nothing from deflate and are stored as-is.
+# Region files hold zlib-compressed chunks; .dat files are usually gzipped NBT.
+STORED_EXTENSIONS = frozenset({'.mca', '.mcc', '.mcr', '.jar', '.gz', '.zip', '.png', '.ogg'})
+
+# zlib and gzip stream headers, used to spot compressed files with other extensions
+COMPRESSED_MAGIC = (b'\x78\x9c', b'\x78\xda', b'\x1f\x8b')
+
+# Files smaller than this are always deflated
+SNIFF_MIN_SIZE = 4096
+
+# Files at least this large are streamed into the archive in chunks rather
+# than read whole by a worker thread
+STREAM_MIN_SIZE = 8 * 1024 * 1024
+STREAM_CHUNK_SIZE = 256 * 1024
+
+# Seconds between backup progress updates
+PROGRESS_INTERVAL = 0.2
+
+# BackupZipFile.write_raw() and write_streamed() rely on ZipFile internals
+# (_lock, _writing, fp, start_dir, _writecheck, _didModify, ZipInfo.FileHeader
+# and ZipInfo._compresslevel), checked against CPython 3.9 - 3.13. If they
+# are missing, entries go through the public writestr()/write() instead.
+ZIP_INTERNALS_OK = (
+    hasattr(zipfile.ZipFile, '_writecheck')
+    and hasattr(zipfile.ZipInfo, 'FileHeader')
+    and hasattr(zipfile.ZipInfo, '_compresslevel')
+)
+
+
+def is_precompressed(file_path: str, head: bytes, size: int) -> bool:
+    """
+    Check whether a file's contents are already compressed.
+
+    Args:
+        file_path: Path to the file
+        head: At least the first two bytes of the file
+        size: File size in bytes
+    """
+    if os.path.splitext(file_path)[1].lower() in STORED_EXTENSIONS:
+        return True
+    return size > SNIFF_MIN_SIZE and head[:2] in COMPRESSED_MAGIC
+
+
+def make_zipinfo(arc_name: str, st: os.stat_result) -> zipfile.ZipInfo:
+    """
+    Build the ZipInfo for a file from a stat result we already have.
+
+    Equivalent to ZipInfo.from_file() without the extra stat() and path
+    normalization; arc_name must already use forward slashes.
+    """
+    date_time = time.localtime(st.st_mtime)[:6]
+    if date_time[0] < 1980:
+        # Zip timestamps can't represent dates before 1980
+        date_time = (1980, 1, 1, 0, 0, 0)
+
+    zinfo = zipfile.ZipInfo(arc_name, date_time)
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.file_size = st.st_size
+    return zinfo
+
+
+def compress_entry(
+    file_path: str,
+    arc_name: str,
+    st: os.stat_result,
+    level: int,
+    precompress: bool = True
+) -> tuple[zipfile.ZipInfo, bytes, int, int]:
+    """
+    Read and compress a single file for BackupZipFile.write_raw().
+
+    Already-compressed files are stored instead of deflated. Safe to call
+    from worker threads - zlib and libdeflate release the GIL while compressing.
+
+    Args:
+        file_path: Path to the file
+        arc_name: Name of the entry in the archive
+        st: Stat result for the file
+        level: Deflate level
+        precompress: If False, only pick the compression type and return the
+            file contents as-is, for a BackupZipFile without raw writes
+
+    Returns:
+        Tuple of (zip_info, compressed_data, crc32, file_size)
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+
+    zinfo = make_zipinfo(arc_name, st)
+    if is_precompressed(file_path, data, len(data)):
+        zinfo.compress_type = zipfile.ZIP_STORED
+        return zinfo, data, zlib.crc32(data), len(data)
+
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    if not precompress:
+        return zinfo, data, zlib.crc32(data), len(data)
+    return zinfo, deflate_raw(data, level), zlib.crc32(data), len(data)
+
+
+class ProgressPrinter:
+    """
+    Prints a running file count from a background thread.
+
+    The backup loop only pushes counts onto a queue, so it never waits on
+    terminal output. A quiet printer only keeps the count.
+    """
+
+    def __init__(
+        self,
+        message: str = "Backed up {} files...",
+        interval: float = PROGRESS_INTERVAL,
+        quiet: bool = False
+    ):
+        self.message = message
+        self.interval = interval
+        self.quiet = quiet
+        self.count = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, n: int = 1) -> None:
+        """Record n more files done."""
+        self._queue.put_nowait(n)
+
+    def start(self) -> None:
+        """Start the printer thread."""
+        if self.quiet:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._print_loop, name="backup-progress", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> int:
+        """Stop the printer thread and return the final count."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self._drain()
+        return self.count
+
+    def _drain(self) -> None:
+        """Add up everything queued since the last drain."""
+        while True:
+            try:
+                self.count += self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def _print_loop(self) -> None:
+        """Background thread that prints the count whenever it changes."""
+        interactive = sys.stdout.isatty()
+        shown = 0
+        while not self._stop.wait(self.interval):
+            self._drain()
+            if self.count != shown:
+                shown = self.count
+                sys.stdout.write(f"\r[mc-server] {self.message.format(shown)}")
+                if interactive:
+                    sys.stdout.flush()
+
+
+class BackupZipFile(zipfile.ZipFile):
+    """
+    ZipFile that can write entries whose data was compressed ahead of time.
+
+    Where the ZipFile internals this needs are missing (see ZIP_INTERNALS_OK),
+    raw_writes is False: compress_entry() must then be called with
+    precompress=False, and entries are compressed by writestr() instead.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.raw_writes = ZIP_INTERNALS_OK and all(
+            hasattr(self, name) for name in ('_lock', '_writing', 'fp', 'start_dir', '_didModify')
+        )
+
+    def write_streamed(self, file_path: str, arc_name: str, st: os.stat_result, level: int) -> None:
+        """
+        Add a large file by streaming it through the archive in chunks.
+
+        Memory use stays constant regardless of file size. Compression uses
+        zlib, as libdeflate has no streaming interface.
+        """
+        with open(file_path, 'rb') as src:
+            head = src.read(2)
+            src.seek(0)
+
+            zinfo = make_zipinfo(arc_name, st)
+            if is_precompressed(file_path, head, zinfo.file_size):
+                zinfo.compress_type = zipfile.ZIP_STORED
+            elif not self.raw_writes:
+                # write() streams too, and takes the level as an argument
+                self.write(file_path, arc_name, zipfile.ZIP_DEFLATED, level)
+                return
+            else:
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                # No public setter for the level before Python 3.13
+                zinfo._compresslevel = level
+
+            with self.open(zinfo, 'w', force_zip64=True) as dst:
+                shutil.copyfileobj(src, dst, STREAM_CHUNK_SIZE)
+
+    def write_raw(self, zinfo: zipfile.ZipInfo, compressed: bytes, crc: int, file_size: int) -> None:
+        """
+        Write an entry whose data is already in its final form.
+
+        The data must match zinfo.compress_type: a raw deflate stream for
+        ZIP_DEFLATED, or the file contents for ZIP_STORED. Since CRC and sizes
+        are known up front, the local header is written once and the data
+        copied straight after it, bypassing zlib.compressobj.
+
+        Without raw_writes, the data is the uncompressed file contents and is
+        handed to writestr() at the archive's compresslevel.
+        """
+        if not self.raw_writes:
+            self.writestr(zinfo, compressed, compresslevel=self.compresslevel)
+            return
+
+        zinfo.CRC = crc
+        zinfo.file_size = file_size
+        zinfo.compress_size = len(compressed)
+        zinfo.flag_bits = 0
+        if not zinfo.external_attr:
+            zinfo.external_attr = 0o600 << 16
+
+        zip64 = file_size > zipfile.ZIP64_LIMIT or len(compressed) > zipfile.ZIP64_LIMIT
+
+        with self._lock:
+            if self._writing:
+                raise ValueError("Can't write to the ZIP file while another write handle is open")
+            self.fp.seek(self.start_dir)
+            zinfo.header_offset = self.fp.tell()
+            self._writecheck(zinfo)
+            self._didModify = True
+            self.fp.write(zinfo.FileHeader(zip64))
+            self.fp.write(compressed)
+            self.start_dir = self.fp.tell()
+            self.filelist.append(zinfo)
+            self.NameToInfo[zinfo.filename] = zinfo
+
 
 @dataclass
 class BackupInfo:
@@ -29,7 +303,11 @@ class BackupInfo:
     @property
     def age_days(self) -> float:
         """Get the age of the backup in days."""
-        return (datetime.now() - self.timestamp).total_seconds() / 86400
+        return self.age_days_from(datetime.now())
+
+    def age_days_from(self, now: datetime) -> float:
+        """Get the age of the backup in days relative to a given time."""
+        return (now - self.timestamp).total_seconds() / 86400
 
     def __str__(self) -> str:
         return f"{self.name} ({format_size(self.size)}, {self.age_days:.1f} days old)"
@@ -45,6 +323,26 @@ class BackupManager:
 
     BACKUP_PREFIX = "backup_"
     BACKUP_SUFFIX = ".zip"
+    _BACKUP_RE = re.compile(r'^backup_(\d{4})-(\d{2})-(\d{2})_(\d{2})-(\d{2})-(\d{2})\.zip$')
+
+    # Replaced worlds are renamed to <name>.pending-delete.<pid>.<n> and removed in the background
+    PENDING_DELETE_MARKER = ".pending-delete."
+
+    # Numbers the pending deletes of this process, so names never collide
+    _pending_ids = itertools.count()
+
+    # Paths whose mtime proves a change when newer than the last backup.
+    # level.dat is rewritten on every save, and a file created, renamed or
+    # deleted (temp-file saves, Syncthing replacing a file) bumps its folder's
+    # mtime. The reverse doesn't hold: region files are rewritten in place,
+    # which leaves every directory mtime alone, so unchanged markers still
+    # need the full walk.
+    CHANGE_MARKERS = (
+        "level.dat", "session.lock", "", "playerdata",
+        "region", "entities", "poi",
+        "DIM-1/region", "DIM-1/entities", "DIM-1/poi",
+        "DIM1/region", "DIM1/entities", "DIM1/poi",
+    )
 
     def __init__(
         self,
@@ -52,7 +350,9 @@ class BackupManager:
         world_folder: Path,
         auto_prune: bool = True,
         keep_minimum: int = 5,
-        keep_days: int = 30
+        keep_days: int = 30,
+        compression_level: int = 4,
+        max_workers: Optional[int] = None
     ):
         """
         Initialize the backup manager.
@@ -63,17 +363,25 @@ class BackupManager:
             auto_prune: Whether to automatically prune old backups
             keep_minimum: Minimum number of backups to keep
             keep_days: Delete backups older than this (if above minimum)
+            compression_level: Deflate level for backup archives (0-9)
+            max_workers: Threads used to compress files (defaults to CPU count)
         """
         self.backup_folder = backup_folder
         self.world_folder = world_folder
         self.auto_prune = auto_prune
         self.keep_minimum = keep_minimum
         self.keep_days = keep_days
+        self.compression_level = compression_level
+        self.max_workers = max_workers or os.cpu_count() or 1
         self.logger = get_logger()
 
         # Track last backup time for change detection
         self._last_backup_time: Optional[datetime] = None
 
+        # Sorted backup list, reused while the backup folder's mtime is unchanged
+        self._backup_cache: Optional[list[BackupInfo]] = None
+        self._cache_mtime: Optional[int] = None
+
     def _parse_backup_filename(self, filename: str) -> Optional[datetime]:
         """
         Parse a backup filename to extract the timestamp.
@@ -83,49 +391,103 @@ class BackupManager:
         Returns:
             datetime if valid, None otherwise
         """
-        if not filename.startswith(self.BACKUP_PREFIX):
-            return None
-        if not filename.endswith(self.BACKUP_SUFFIX):
+        m = self._BACKUP_RE.match(filename)
+        if m is None:
             return None
 
-        timestamp_str = filename[len(self.BACKUP_PREFIX):-len(self.BACKUP_SUFFIX)]
-
         try:
-            return datetime.strptime(timestamp_str, "%Y-%m-%d_%H-%M-%S")
+            return datetime(*map(int, m.groups()))
         except ValueError:
+            # Matched the pattern but not a real date (e.g. month 13)
             return None
 
+    def _scandir_files(self, root: Path) -> Iterator[os.DirEntry]:
+        """
+        Recursively yield directory entries for every regular file under root.
+
+        Uses os.scandir so file type (and on most platforms stat) information
+        comes from the directory listing instead of extra stat() calls.
+        Symlinks are not followed; unreadable directories are skipped.
+        """
+        stack = [os.fspath(root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry
+            except PermissionError as e:
+                self.logger.warning(f"Skipping unreadable directory: {e}")
+
     def list_backups(self) -> list[BackupInfo]:
         """
         List all valid backups, sorted by timestamp (newest first).
 
+        The folder is only rescanned when its mtime changes (a file was
+        added, removed or renamed); otherwise the cached list is returned.
+
         Returns:
             List of BackupInfo objects
         """
-        if not self.backup_folder.exists():
+        try:
+            folder_mtime = os.stat(self.backup_folder).st_mtime_ns
+        except OSError:
             return []
 
+        if self._backup_cache is not None and folder_mtime == self._cache_mtime:
+            return list(self._backup_cache)
+
         backups = []
 
-        for file_path in self.backup_folder.glob(f"{self.BACKUP_PREFIX}*{self.BACKUP_SUFFIX}"):
-            timestamp = self._parse_backup_filename(file_path.name)
-            if timestamp is None:
-                continue
+        with os.scandir(self.backup_folder) as it:
+            for entry in it:
+                name = entry.name
+                # Cheap filter so unrelated files never reach the regex
+                if not (name.startswith(self.BACKUP_PREFIX) and name.endswith(self.BACKUP_SUFFIX)):
+                    continue
 
-            try:
-                size = file_path.stat().st_size
-            except OSError:
-                continue
+                timestamp = self._parse_backup_filename(name)
+                if timestamp is None:
+                    continue
 
-            backups.append(BackupInfo(
-                path=file_path,
-                timestamp=timestamp,
-                size=size,
-            ))
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+
+                backups.append(BackupInfo(
+                    path=Path(entry.path),
+                    timestamp=timestamp,
+                    size=size,
+                ))
 
         # Sort by timestamp, newest first
-        backups.sort(key=lambda b: b.timestamp, reverse=True)
-        return backups
+        backups.sort(key=attrgetter('timestamp'), reverse=True)
+
+        self._backup_cache = backups
+        self._cache_mtime = folder_mtime
+        return list(backups)
+
+    def _update_cache(self, added: Optional[BackupInfo] = None, removed: Optional[list[BackupInfo]] = None) -> None:
+        """Apply our own changes to the cached backup list instead of rescanning."""
+        if self._backup_cache is None:
+            return
+
+        if added is not None:
+            # A backup made within the same second overwrites the previous file
+            self._backup_cache = [b for b in self._backup_cache if b.path != added.path]
+            self._backup_cache.append(added)
+            self._backup_cache.sort(key=attrgetter('timestamp'), reverse=True)
+        if removed:
+            removed_paths = {b.path for b in removed}
+            self._backup_cache = [b for b in self._backup_cache if b.path not in removed_paths]
+
+        try:
+            self._cache_mtime = os.stat(self.backup_folder).st_mtime_ns
+        except OSError:
+            self._backup_cache = None
 
     def get_latest_backup(self) -> Optional[BackupInfo]:
         """Get the most recent backup, if any."""
@@ -136,7 +498,10 @@ class BackupManager:
         """
         Check if the world has changed since the last backup.
 
-        This is a simple check based on modification times.
+        This is a simple check based on modification times. A few marker
+        paths are checked first, and any of them being newer than the
+        backup settles it; otherwise every file is checked, since in-place
+        region writes don't show up in the markers.
 
         Returns:
             True if world has changed or no backups exist
@@ -148,25 +513,34 @@ class BackupManager:
         if not self.world_folder.exists():
             return False
 
-        # Check if any file in world folder is newer than the backup
-        backup_time = latest.timestamp.timestamp()
+        # Integer nanoseconds, so each comparison avoids a float conversion
+        backup_time_ns = int(latest.timestamp.timestamp()) * 1_000_000_000
 
-        for file_path in self.world_folder.rglob("*"):
-            if file_path.is_file():
-                try:
-                    if file_path.stat().st_mtime > backup_time:
-                        return True
-                except OSError:
-                    continue
+        # Cheap positive check: a handful of stats instead of one per file
+        for name in self.CHANGE_MARKERS:
+            try:
+                if os.stat(self.world_folder / name).st_mtime_ns > backup_time_ns:
+                    return True
+            except OSError:
+                continue
+
+        # Check if any file in world folder is newer than the backup
+        for entry in self._scandir_files(self.world_folder):
+            try:
+                if entry.stat(follow_symlinks=False).st_mtime_ns > backup_time_ns:
+                    return True
+            except OSError:
+                continue
 
         return False
 
-    def create_backup(self, description: Optional[str] = None) -> BackupInfo:
+    def create_backup(self, description: Optional[str] = None, quiet: bool = False) -> BackupInfo:
         """
         Create a new backup of the world folder.
 
         Args:
             description: Optional description (not currently used in filename)
+            quiet: Only log, without printing progress to the console
 
         Returns:
             BackupInfo for the new backup
@@ -186,37 +560,81 @@ class BackupManager:
         backup_path = self.backup_folder / backup_name
 
         self.logger.info(f"Creating backup: {backup_name}")
-        print(f"[mc-server] Creating backup: {backup_name}...")
+        if not quiet:
+            print(f"[mc-server] Creating backup: {backup_name}...")
 
+        progress = ProgressPrinter(quiet=quiet)
         try:
-            # Create zip file
-            with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            # Sort so archives of the same world are laid out identically
+            entries = sorted(self._scandir_files(self.world_folder), key=lambda e: e.path)
+
+            # Archive names are the paths relative to the world's parent folder,
+            # so the archive contains the "world" folder itself
+            prefix_len = len(os.path.join(os.fspath(self.world_folder.parent), ''))
+
+            # Files are compressed in a thread pool and written to the zip in
+            # order by this thread. The number of compressed files waiting to be
+            # written is bounded to keep memory use in check, and large files
+            # are streamed by this thread instead of being read whole.
+            progress.start()
+            with BackupZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED,
+                               compresslevel=self.compression_level) as zf, \
+                    ThreadPoolExecutor(max_workers=self.max_workers) as pool:
                 file_count = 0
-                for file_path in self.world_folder.rglob("*"):
-                    if file_path.is_file():
-                        # Calculate relative path within the world folder
-                        arc_name = file_path.relative_to(self.world_folder.parent)
-                        zf.write(file_path, arc_name)
-                        file_count += 1
+                pending = deque()
+
+                def file_written() -> None:
+                    nonlocal file_count
+                    file_count += 1
+                    # Progress indicator for large worlds
+                    progress.add()
+
+                def write_next() -> None:
+                    zf.write_raw(*pending.popleft().result())
+                    file_written()
+
+                for entry in entries:
+                    file_path = entry.path
+                    arc_name = file_path[prefix_len:].replace(os.sep, '/')
+
+                    st = entry.stat(follow_symlinks=False)
+
+                    if st.st_size >= STREAM_MIN_SIZE:
+                        # Keep archive order: write everything queued before it first
+                        while pending:
+                            write_next()
+                        zf.write_streamed(file_path, arc_name, st, self.compression_level)
+                        file_written()
+                        continue
+
+                    pending.append(pool.submit(
+                        compress_entry, file_path, arc_name, st, self.compression_level, zf.raw_writes
+                    ))
+                    if len(pending) >= self.max_workers * 2:
+                        write_next()
 
-                        # Progress indicator for large worlds
-                        if file_count % 100 == 0:
-                            print(f"\r[mc-server] Backed up {file_count} files...", end="", flush=True)
+                while pending:
+                    write_next()
 
-                print(f"\r[mc-server] Backed up {file_count} files", end="")
+                progress.stop()
+                if not quiet:
+                    print(f"\r[mc-server] Backed up {file_count} files", end="")
 
             # Get size of created backup
             size = backup_path.stat().st_size
-            print(f" ({format_size(size)})")
+            if not quiet:
+                print(f" ({format_size(size)})")
 
             self._last_backup_time = datetime.now()
             self.logger.info(f"Backup created: {backup_name} ({format_size(size)})")
 
-            return BackupInfo(
+            backup = BackupInfo(
                 path=backup_path,
-                timestamp=datetime.strptime(timestamp, "%Y-%m-%d_%H-%M-%S"),
+                timestamp=self._parse_backup_filename(backup_name),
                 size=size,
             )
+            self._update_cache(added=backup)
+            return backup
 
         except (OSError, zipfile.BadZipFile) as e:
             # Clean up partial backup
@@ -226,6 +644,9 @@ class BackupManager:
                 except OSError:
                     pass
             raise BackupError(f"Failed to create backup: {e}")
+        finally:
+            # Whatever ended the backup, don't leave the printer running
+            progress.stop()
 
     def restore_backup(self, backup: BackupInfo, target: Optional[Path] = None) -> bool:
         """
@@ -245,6 +666,7 @@ class BackupManager:
             raise BackupError(f"Backup file not found: {backup.path}")
 
         target = target or self.world_folder
+        self.cleanup_pending_deletes(target.parent)
 
         self.logger.info(f"Restoring backup: {backup.name}")
         print(f"[mc-server] Restoring backup: {backup.name}...")
@@ -259,22 +681,9 @@ class BackupManager:
             self.logger.debug(f"Moved existing world to {old_world}")
 
         try:
-            # Extract backup
-            with zipfile.ZipFile(backup.path, 'r') as zf:
-                # The backup includes the "world" folder name in the archive
-                zf.extractall(target.parent)
-
-            self.logger.info(f"Restored backup successfully")
-            print(f"[mc-server] {Colors.success('Backup restored successfully')}")
-
-            # Remove old world backup
-            if old_world and old_world.exists():
-                shutil.rmtree(old_world)
-                self.logger.debug(f"Removed old world backup")
-
-            return True
-
-        except (OSError, zipfile.BadZipFile) as e:
+            # Extract backup. The backup includes the "world" folder name in the archive
+            self._extract_parallel(backup.path, target.parent)
+        except (OSError, zipfile.BadZipFile, BackupError) as e:
             # Try to restore old world
             if old_world and old_world.exists():
                 if target.exists():
@@ -284,6 +693,115 @@ class BackupManager:
 
             raise BackupError(f"Failed to restore backup: {e}")
 
+        self.logger.info(f"Restored backup successfully")
+        print(f"[mc-server] {Colors.success('Backup restored successfully')}")
+
+        # Remove old world backup. This is cleanup, not part of the restore:
+        # if it fails the old world just stays behind as <world>.old
+        if old_world and old_world.exists():
+            pending = old_world.parent / (
+                f"{target.name}{self.PENDING_DELETE_MARKER}{os.getpid()}.{next(self._pending_ids)}"
+            )
+            try:
+                old_world.rename(pending)
+            except OSError as e:
+                self.logger.warning(f"Could not move aside {old_world}: {e}")
+            else:
+                self._delete_in_background([pending])
+
+        return True
+
+    def _extract_parallel(self, archive: Path, dest: Path) -> None:
+        """
+        Extract an archive using a pool of threads.
+
+        Each worker opens its own ZipFile so reads don't contend on one file
+        position. Directories are created up front so workers never race on
+        creating the same parent.
+        """
+        with zipfile.ZipFile(archive, 'r') as zf:
+            infos = zf.infolist()
+
+        dirs = set()
+        files = []
+        for info in infos:
+            parts = info.filename.replace('\\', '/').split('/')
+            if info.filename.startswith('/') or '..' in parts or ':' in parts[0]:
+                raise BackupError(f"Unsafe path in backup archive: {info.filename}")
+            path = dest.joinpath(*parts)
+            if info.is_dir():
+                dirs.add(path)
+            else:
+                dirs.add(path.parent)
+                files.append(info)
+
+        for directory in sorted(dirs, key=lambda d: len(d.parts)):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        def extract_batch(batch: list[zipfile.ZipInfo]) -> None:
+            with zipfile.ZipFile(archive, 'r') as worker_zf:
+                for info in batch:
+                    worker_zf.extract(info, dest)
+
+        workers = max(1, min(self.max_workers, len(files)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Consume results so worker errors are raised here
+            for _ in pool.map(extract_batch, [files[i::workers] for i in range(workers)]):
+                pass
+
+    def _delete_in_background(self, paths: list[Path]) -> None:
+        """
+        Delete directory trees on a background thread.
+
+        Renaming a world aside is instant; deleting a large one is not. The
+        thread is a daemon, so a command like --restore can exit without
+        waiting for it; whatever is left over is removed by
+        cleanup_pending_deletes on the next start or restore.
+        """
+        def delete_all() -> None:
+            for path in paths:
+                self._delete_tree(path)
+
+        threading.Thread(target=delete_all, name="delete-old-world", daemon=True).start()
+
+    def _delete_tree(self, path: Path) -> None:
+        """Delete a directory tree, logging instead of raising on failure."""
+        try:
+            shutil.rmtree(path)
+            self.logger.debug(f"Removed old world backup: {path}")
+        except OSError as e:
+            self.logger.warning(f"Could not remove {path}: {e}")
+
+    def cleanup_pending_deletes(self, folder: Optional[Path] = None) -> None:
+        """
+        Remove replaced worlds left behind by an interrupted background delete.
+
+        The trees are deleted on a background thread, so a leftover
+        multi-GB world doesn't hold up startup.
+
+        Args:
+            folder: Folder to scan (defaults to the world folder's parent)
+        """
+        folder = folder or self.world_folder.parent
+        try:
+            with os.scandir(folder) as it:
+                leftovers = [
+                    Path(entry.path) for entry in it
+                    if self.PENDING_DELETE_MARKER in entry.name and entry.is_dir(follow_symlinks=False)
+                ]
+        except OSError:
+            return
+
+        # Skip trees another thread in this process is still deleting
+        own_prefix = f"{self.PENDING_DELETE_MARKER}{os.getpid()}."
+        leftovers = [path for path in leftovers if own_prefix not in path.name]
+        if not leftovers:
+            return
+
+        for path in leftovers:
+            self.logger.info(f"Removing leftover old world: {path.name}")
+        self._delete_in_background(leftovers)
+
     def prune_backups(self) -> list[BackupInfo]:
         """
         Remove old backups according to retention policy.
@@ -306,21 +824,19 @@ class BackupManager:
 
         cutoff = datetime.now() - timedelta(days=self.keep_days)
 
-        for i, backup in enumerate(backups):
-            # Always keep minimum number of backups
-            if len(backups) - len(deleted) <= self.keep_minimum:
-                break
-
-            # Delete if older than cutoff
+        # Backups are sorted newest first, so the first keep_minimum are always
+        # kept and only the rest are candidates for deletion
+        for backup in backups[self.keep_minimum:]:
             if backup.timestamp < cutoff:
                 try:
-                    backup.path.unlink()
+                    os.unlink(backup.path)
                     deleted.append(backup)
                     self.logger.info(f"Pruned old backup: {backup.name}")
                 except OSError as e:
                     self.logger.error(f"Failed to delete backup {backup.name}: {e}")
 
         if deleted:
+            self._update_cache(removed=deleted)
             print(f"[mc-server] Pruned {len(deleted)} old backup(s)")
 
         return deleted
@@ -353,10 +869,12 @@ class BackupManager:
         print(f"\n[mc-server] {Colors.info('Available Backups')} ({len(backups)} backups, {format_size(total_size)} total)")
         print()
 
+        now = datetime.now()
         for i, backup in enumerate(backups):
-            age_str = f"{backup.age_days:.1f} days ago"
-            if backup.age_days < 1:
-                hours = backup.age_days * 24
+            age_days = backup.age_days_from(now)
+            age_str = f"{age_days:.1f} days ago"
+            if age_days < 1:
+                hours = age_days * 24
                 age_str = f"{hours:.1f} hours ago"
 
             marker = Colors.success("(latest)") if i == 0 else ""
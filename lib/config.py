@@ -13,6 +13,14 @@ import yaml
 
 from .utils import get_hostname, check_file_permissions, get_logger, Colors
 
+# Prefer the libyaml-backed loader, which is much faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+_warned_pure_yaml = False
+
 
 @dataclass
 class ServerConfig:
@@ -32,6 +40,7 @@ class BackupConfig:
     auto_prune: bool = True
     keep_minimum: int = 5
     keep_days: int = 30
+    compression_level: int = 4
 
 
 @dataclass
@@ -136,9 +145,14 @@ def find_secrets_file() -> Optional[Path]:
 
 def load_yaml_file(path: Path) -> dict[str, Any]:
     """Load a YAML file and return its contents."""
+    global _warned_pure_yaml
+    if _YamlLoader is yaml.SafeLoader and not _warned_pure_yaml:
+        get_logger().warning("PyYAML C extension not available, using the slower pure-Python loader")
+        _warned_pure_yaml = True
+
     try:
         with open(path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
             return data if data else {}
     except yaml.YAMLError as e:
         raise ConfigError(f"Invalid YAML in {path}: {e}")
@@ -198,11 +212,20 @@ def parse_backup_config(data: dict[str, Any], server_folder: Path) -> BackupConf
         except OSError as e:
             raise ConfigError(f"Could not create backup folder: {e}")
 
+    compression_level = backup_data.get('compression_level', 4)
+    # bool is an int subclass, but `compression_level: true` is a config mistake
+    if (isinstance(compression_level, bool) or not isinstance(compression_level, int)
+            or not 0 <= compression_level <= 9):
+        raise ConfigError(
+            f"backup.compression_level must be an integer from 0 to 9, got {compression_level!r}"
+        )
+
     return BackupConfig(
         folder=folder,
         auto_prune=backup_data.get('auto_prune', True),
         keep_minimum=backup_data.get('keep_minimum', 5),
         keep_days=backup_data.get('keep_days', 30),
+        compression_level=compression_level,
     )
 
 
@@ -284,15 +307,15 @@ def ensure_directories(config_data: dict[str, Any]) -> bool:
 
         resolved = Path(raw_path).expanduser().resolve()
         if resolved.exists():
-            print(f"  {Colors.success('✓')} {description}: {resolved}")
+            print(f"  {Colors.OK} {description}: {resolved}")
             logger.info(f"Directory verified: {description} -> {resolved}")
         else:
             try:
                 resolved.mkdir(parents=True, exist_ok=True)
-                print(f"  {Colors.success('✓')} {description}: Created {resolved}")
+                print(f"  {Colors.OK} {description}: Created {resolved}")
                 logger.info(f"Directory created: {description} -> {resolved}")
             except OSError as e:
-                print(f"  {Colors.error('✗')} {description}: Failed to create {resolved}: {e}")
+                print(f"  {Colors.FAIL} {description}: Failed to create {resolved}: {e}")
                 logger.error(f"Failed to create directory: {description} -> {resolved}: {e}")
                 all_ok = False
 
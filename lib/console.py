@@ -4,9 +4,12 @@ Interactive console for the Minecraft server wrapper.
 Handles user input, built-in commands, and pass-through to the server.
 """
 
+import atexit
+import queue
 import readline
 import sys
 import threading
+from pathlib import Path
 from typing import Callable, Optional
 
 from .server import MinecraftServer
@@ -15,11 +18,65 @@ from .syncthing import SyncthingClient
 from .utils import get_logger, format_duration, Colors
 
 
+# Console command history, kept next to the user config
+HISTORY_FILE = Path.home() / ".config" / "mc-server" / "history"
+HISTORY_LENGTH = 1000
+
+# Fixed, pre-colored text for the status and help screens. Color support
+# is a property of the process's stdout, so it can be decided at import.
+_RULE = "-" * 40
+_HDR_STATUS = Colors.info('Server Status')
+_HDR_HELP = Colors.info('Available Commands')
+_HDR_WRAPPER = Colors.info('Wrapper Commands:')
+_HDR_SERVER = Colors.info('Server Commands:')
+_HDR_PROTECTED = Colors.warning('Protected Commands:')
+_STATUS_RUNNING = Colors.success('Running')
+_STATUS_STOPPED = Colors.error('Stopped')
+_SYNC_UNREACHABLE = Colors.warning('Unreachable')
+
+# Most server lines written to the terminal in one go
+MAX_OUTPUT_BATCH = 256
+
+# Put on the server's output queue by stop() to wake an output loop blocked
+# on it; the loops skip it
+_WAKE = object()
+
+
+def _collect_output(output_queue: queue.Queue, first: str) -> tuple[str, bool]:
+    """
+    Join a line of server output with any others already queued.
+
+    Args:
+        output_queue: Queue of server output lines (None marks the end)
+        first: Line already taken from the queue
+
+    Returns:
+        Tuple of (newline-terminated text, whether the end marker was seen)
+    """
+    lines = [first if first.endswith('\n') else first + '\n']
+    ended = False
+    while len(lines) < MAX_OUTPUT_BATCH:
+        try:
+            line = output_queue.get_nowait()
+        except queue.Empty:
+            break
+        if line is None:
+            ended = True
+            break
+        if line is _WAKE:
+            continue
+        lines.append(line if line.endswith('\n') else line + '\n')
+    return ''.join(lines), ended
+
+
 class Console:
     """Interactive console for the server wrapper."""
 
     PROMPT = "[mc-server] > "
 
+    # Carriage return + ANSI erase-entire-line
+    CLEAR_LINE = "\r\x1b[2K"
+
     # Built-in commands that are handled by the wrapper
     BUILTIN_COMMANDS = {
         'quit': 'Trigger safe shutdown sequence',
@@ -54,14 +111,25 @@ class Console:
         self.on_shutdown = on_shutdown
         self.logger = get_logger()
 
-        self._running = False
+        self._stop = threading.Event()
         self._output_thread: Optional[threading.Thread] = None
         self._shutdown_requested = False
+        self._at_prompt = False
+
+        # Built-in command name -> handler
+        self._dispatch: dict[str, Callable[[], None]] = {
+            'quit': self._cmd_quit,
+            'exit': self._cmd_quit,
+            'backup': self._cmd_backup,
+            'status': self._cmd_status,
+            'help': self._cmd_help,
+        }
 
     def start(self) -> None:
         """Start the interactive console."""
-        self._running = True
+        self._stop.clear()
         self._shutdown_requested = False
+        self._load_history()
 
         # Start output thread to display server output
         self._output_thread = threading.Thread(
@@ -76,34 +144,66 @@ class Console:
 
     def stop(self) -> None:
         """Stop the console."""
-        self._running = False
+        self._stop.set()
         if self._output_thread:
+            self.server.output_queue.put(_WAKE)
             self._output_thread.join(timeout=2)
             self._output_thread = None
 
+    def _load_history(self) -> None:
+        """Load command history and arrange for it to be saved on exit."""
+        readline.set_history_length(HISTORY_LENGTH)
+        try:
+            readline.read_history_file(HISTORY_FILE)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.debug(f"Could not read console history: {e}")
+        atexit.unregister(self._save_history)
+        atexit.register(self._save_history)
+
+    def _save_history(self) -> None:
+        """Write command history to disk."""
+        try:
+            HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+            readline.write_history_file(HISTORY_FILE)
+        except OSError as e:
+            self.logger.debug(f"Could not save console history: {e}")
+
     def _output_loop(self) -> None:
         """Background thread that displays server output."""
-        while self._running and self.server.is_running:
-            line = self.server.read_line(timeout=0.1)
-            if line:
-                # Print server output without the prompt
-                # Clear current line, print output, restore prompt
-                sys.stdout.write('\r' + ' ' * 80 + '\r')  # Clear line
-                sys.stdout.write(line)
-                if not line.endswith('\n'):
-                    sys.stdout.write('\n')
-                sys.stdout.write(self.PROMPT)
-                sys.stdout.flush()
+        while not self._stop.is_set():
+            line = self.server.output_queue.get()
+            if line is _WAKE:
+                continue
+            if line is None:
+                # Server output has ended
+                break
+
+            # Print server output without the prompt
+            # Clear current line, print output, restore prompt and any
+            # half-typed command
+            text, ended = _collect_output(self.server.output_queue, line)
+            sys.stdout.write(
+                self.CLEAR_LINE + text + self.PROMPT + readline.get_line_buffer()
+            )
+            sys.stdout.flush()
+            if ended:
+                break
 
     def _input_loop(self) -> None:
         """Main loop that reads and processes user input."""
         print(f"\n{Colors.info('Minecraft Server Console')}")
         print(f"Type 'help' for available commands, 'quit' to shutdown safely.\n")
 
-        while self._running and self.server.is_running:
+        while not self._stop.is_set() and self.server.is_running:
             try:
                 # Read input
-                line = input(self.PROMPT).strip()
+                self._at_prompt = True
+                try:
+                    line = input(self.PROMPT).strip()
+                finally:
+                    self._at_prompt = False
 
                 if not line:
                     continue
@@ -121,25 +221,37 @@ class Console:
                 self._cmd_quit()
                 break
             except KeyboardInterrupt:
-                # Ctrl+C is handled by signal handler
+                # Raised by interrupt() to leave input(); the loop condition
+                # sees the stop request
                 print()
                 continue
 
-        self._running = False
+        self._stop.set()
+
+    def interrupt(self) -> None:
+        """
+        Request the console to stop; safe to call from a signal handler.
+
+        If the main thread is waiting at the prompt, KeyboardInterrupt is
+        raised so input() returns; otherwise the console stops once the
+        current command has finished.
+        """
+        self._shutdown_requested = True
+        self._stop.set()
+        if self._at_prompt:
+            raise KeyboardInterrupt
 
     def _process_command(self, line: str) -> None:
         """Process a command line."""
-        cmd = line.lower().split()[0] if line.split() else ""
+        parts = line.split(None, 1)
+        if not parts:
+            return
+        cmd = parts[0].lower()
 
         # Check for built-in commands
-        if cmd in ('quit', 'exit'):
-            self._cmd_quit()
-        elif cmd == 'backup':
-            self._cmd_backup()
-        elif cmd == 'status':
-            self._cmd_status()
-        elif cmd == 'help':
-            self._cmd_help()
+        handler = self._dispatch.get(cmd)
+        if handler is not None:
+            handler()
         elif cmd in self.PROTECTED_COMMANDS:
             self._handle_protected(cmd, line)
         else:
@@ -150,7 +262,7 @@ class Console:
         """Handle quit command."""
         print(f"\n{Colors.info('Initiating safe shutdown...')}")
         self._shutdown_requested = True
-        self._running = False
+        self._stop.set()
 
         if self.on_shutdown:
             self.on_shutdown()
@@ -167,17 +279,17 @@ class Console:
 
     def _cmd_status(self) -> None:
         """Handle status command."""
-        print(f"\n{Colors.info('Server Status')}")
-        print("-" * 40)
+        print(f"\n{_HDR_STATUS}")
+        print(_RULE)
 
         # Server info
         if self.server.is_running:
             uptime = self.server.uptime
-            print(f"  Status:    {Colors.success('Running')}")
+            print(f"  Status:    {_STATUS_RUNNING}")
             print(f"  PID:       {self.server.pid}")
             print(f"  Uptime:    {format_duration(uptime) if uptime else 'Unknown'}")
         else:
-            print(f"  Status:    {Colors.error('Stopped')}")
+            print(f"  Status:    {_STATUS_STOPPED}")
 
         # Backup info
         latest_backup = self.backup_manager.get_latest_backup()
@@ -193,29 +305,27 @@ class Console:
                 sync_status = "Paused" if is_paused else "Active"
                 print(f"  Syncthing: {sync_status}")
             except Exception:
-                print(f"  Syncthing: {Colors.warning('Unreachable')}")
+                print(f"  Syncthing: {_SYNC_UNREACHABLE}")
         else:
             print(f"  Syncthing: Disabled")
 
-        print("-" * 40)
+        print(_RULE)
         print()
 
     def _cmd_help(self) -> None:
         """Handle help command."""
-        print(f"\n{Colors.info('Available Commands')}")
-        print("-" * 40)
-        print(f"\n{Colors.info('Wrapper Commands:')}")
-        for cmd, desc in self.BUILTIN_COMMANDS.items():
-            print(f"  {cmd:12} - {desc}")
-
-        print(f"\n{Colors.info('Server Commands:')}")
-        print("  Any other command is passed directly to the Minecraft server.")
-        print("  Common commands: list, say <msg>, op <player>, whitelist add <player>")
-
-        print(f"\n{Colors.warning('Protected Commands:')}")
-        print("  stop         - Use 'quit' instead for safe shutdown")
-        print("-" * 40)
-        print()
+        lines = [f"\n{_HDR_HELP}", _RULE, f"\n{_HDR_WRAPPER}"]
+        lines.extend(f"  {cmd:12} - {desc}" for cmd, desc in self.BUILTIN_COMMANDS.items())
+        lines += [
+            f"\n{_HDR_SERVER}",
+            "  Any other command is passed directly to the Minecraft server.",
+            "  Common commands: list, say <msg>, op <player>, whitelist add <player>",
+            f"\n{_HDR_PROTECTED}",
+            "  stop         - Use 'quit' instead for safe shutdown",
+            _RULE,
+            "",
+        ]
+        print("\n".join(lines))
 
     def _handle_protected(self, cmd: str, full_line: str) -> None:
         """Handle a protected command."""
@@ -227,7 +337,16 @@ class Console:
             print("  - Resumes Syncthing")
             print()
 
-            response = input("Do you want to use safe shutdown instead? [Y/n]: ").strip().lower()
+            # Let interrupt() abort this prompt like the main one
+            self._at_prompt = True
+            try:
+                response = input("Do you want to use safe shutdown instead? [Y/n]: ").strip().lower()
+            except KeyboardInterrupt:
+                print()
+                return
+            finally:
+                self._at_prompt = False
+
             if response in ('', 'y', 'yes'):
                 self._cmd_quit()
             else:
@@ -240,12 +359,12 @@ class NonInteractiveOutput:
 
     def __init__(self, server: MinecraftServer):
         self.server = server
-        self._running = False
+        self._stop = threading.Event()
         self._thread: Optional[threading.Thread] = None
 
     def start(self) -> None:
         """Start displaying server output."""
-        self._running = True
+        self._stop.clear()
         self._thread = threading.Thread(
             target=self._output_loop,
             name="output-display",
@@ -255,17 +374,24 @@ class NonInteractiveOutput:
 
     def stop(self) -> None:
         """Stop displaying output."""
-        self._running = False
+        self._stop.set()
         if self._thread:
+            self.server.output_queue.put(_WAKE)
             self._thread.join(timeout=2)
             self._thread = None
 
     def _output_loop(self) -> None:
         """Display server output."""
-        while self._running and self.server.is_running:
-            line = self.server.read_line(timeout=0.1)
-            if line:
-                sys.stdout.write(line)
-                if not line.endswith('\n'):
-                    sys.stdout.write('\n')
-                sys.stdout.flush()
+        while not self._stop.is_set():
+            line = self.server.output_queue.get()
+            if line is _WAKE:
+                continue
+            if line is None:
+                # Server output has ended
+                break
+
+            text, ended = _collect_output(self.server.output_queue, line)
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            if ended:
+                break
@@ -4,15 +4,24 @@ World integrity checks for the Minecraft server wrapper.
 Scans Minecraft region files (.mca) to detect corruption.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from .utils import get_logger, format_size, Colors
 
 
 # Minecraft region files use 4096-byte sectors
 SECTOR_SIZE = 4096
+SECTOR_MASK = SECTOR_SIZE - 1
+
+# Two header sectors (chunk locations and timestamps)
+MIN_REGION_SIZE = SECTOR_SIZE * 2
+
+# Upper bound on threads used to stat region files concurrently
+MAX_SCAN_WORKERS = 32
 
 
 @dataclass
@@ -59,53 +68,78 @@ class IntegrityReport:
         )
 
 
-def check_region_file(file_path: Path) -> Optional[RegionFileIssue]:
+def check_region_file(file_path: Path, size: int) -> Optional[RegionFileIssue]:
     """
     Check a single region file for corruption.
 
     Args:
         file_path: Path to the .mca file
+        size: File size in bytes
 
     Returns:
         RegionFileIssue if problem found, None if OK
     """
-    try:
-        size = file_path.stat().st_size
-
-        # Check for zero-byte files
-        if size == 0:
-            return RegionFileIssue(
-                file=file_path,
-                issue_type="zero_byte",
-                details="File is empty (0 bytes)"
-            )
-
-        # Check for truncated files (size should be multiple of sector size)
-        # A valid region file should be at least 8192 bytes (2 sectors for headers)
-        if size < SECTOR_SIZE * 2:
-            return RegionFileIssue(
-                file=file_path,
-                issue_type="truncated",
-                details=f"File too small ({format_size(size)}, expected at least 8KB)"
-            )
-
-        # Check if size is a multiple of sector size
-        if size % SECTOR_SIZE != 0:
-            return RegionFileIssue(
-                file=file_path,
-                issue_type="truncated",
-                details=f"Size ({format_size(size)}) not a multiple of {SECTOR_SIZE} bytes"
-            )
-
-        return None
+    # Check for zero-byte files
+    if size == 0:
+        return RegionFileIssue(
+            file=file_path,
+            issue_type="zero_byte",
+            details="File is empty (0 bytes)"
+        )
 
-    except OSError as e:
+    # Check for truncated files (size should be multiple of sector size)
+    # A valid region file should be at least 8192 bytes (2 sectors for headers)
+    if size < MIN_REGION_SIZE:
         return RegionFileIssue(
             file=file_path,
+            issue_type="truncated",
+            details=f"File too small ({format_size(size)}, expected at least 8KB)"
+        )
+
+    # Check if size is a multiple of sector size
+    if size & SECTOR_MASK:
+        return RegionFileIssue(
+            file=file_path,
+            issue_type="truncated",
+            details=f"Size ({format_size(size)}) not a multiple of {SECTOR_SIZE} bytes"
+        )
+
+    return None
+
+
+def _iter_region_entries(region_folder: Path) -> Iterator[os.DirEntry]:
+    """Yield directory entries for the .mca files in a region folder."""
+    try:
+        with os.scandir(region_folder) as it:
+            for entry in it:
+                if entry.name.endswith(".mca"):
+                    yield entry
+    except OSError:
+        return
+
+
+def _check_region_entry(entry: os.DirEntry) -> tuple[int, Optional[RegionFileIssue]]:
+    """
+    Check a region file from its directory entry.
+
+    Returns:
+        Tuple of (size in bytes, RegionFileIssue or None); size is 0 if
+        the file could not be stat'ed
+    """
+    try:
+        size = entry.stat().st_size
+    except OSError as e:
+        return 0, RegionFileIssue(
+            file=Path(entry.path),
             issue_type="unreadable",
             details=str(e)
         )
 
+    # Healthy files are the common case; only build a Path for bad ones
+    if size >= MIN_REGION_SIZE and not size & SECTOR_MASK:
+        return size, None
+    return size, check_region_file(Path(entry.path), size)
+
 
 def find_region_folders(world_folder: Path) -> list[Path]:
     """
@@ -137,15 +171,115 @@ def find_region_folders(world_folder: Path) -> list[Path]:
         region_folders.append(end)
 
     # Also check for modded dimensions (DIM* pattern)
-    for dim_folder in world_folder.glob("DIM*"):
-        if dim_folder.is_dir():
-            region = dim_folder / "region"
-            if region.exists() and region not in region_folders:
-                region_folders.append(region)
+    try:
+        with os.scandir(world_folder) as it:
+            for entry in it:
+                if entry.name.startswith("DIM") and entry.is_dir():
+                    region = world_folder / entry.name / "region"
+                    if region not in region_folders and region.exists():
+                        region_folders.append(region)
+    except OSError:
+        pass
 
     return region_folders
 
 
+def _iter_scan(
+    world_folder: Path, report: IntegrityReport, stats: dict
+) -> Iterator[RegionFileIssue]:
+    """
+    Walk a world's region files once, yielding issues as they are found.
+
+    The report's counts, issues and error, and the stats dictionary, are
+    filled in as the walk goes; they are complete once the iterator is
+    exhausted.
+
+    Args:
+        world_folder: Path to the world folder
+        report: IntegrityReport to fill in
+        stats: Stats dictionary to fill in
+    """
+    stats['exists'] = world_folder.exists()
+    if not stats['exists']:
+        report.error = "World folder does not exist"
+        return
+
+    # Find all region folders
+    region_folders = find_region_folders(world_folder)
+    stats['region_folders'] = len(region_folders)
+
+    if not region_folders:
+        report.error = "No region folders found (world may be empty or invalid)"
+        return
+
+    mca_entries = [
+        entry
+        for region_folder in region_folders
+        for entry in _iter_region_entries(region_folder)
+    ]
+    report.total_files = len(mca_entries)
+    report.checked_files = len(mca_entries)
+    stats['region_files'] = len(mca_entries)
+
+    # The checks are stat-bound, so overlap them on a thread pool
+    if mca_entries:
+        workers = min(MAX_SCAN_WORKERS, len(mca_entries))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for size, issue in executor.map(_check_region_entry, mca_entries):
+                stats['total_size'] += size
+                if issue is not None:
+                    report.issues.append(issue)
+                    yield issue
+
+
+def _new_scan(world_folder: Path) -> tuple[IntegrityReport, dict]:
+    """Create an empty report and stats dictionary for a scan."""
+    report = IntegrityReport(world_folder=world_folder)
+    stats = {
+        'exists': False,
+        'region_folders': 0,
+        'region_files': 0,
+        'total_size': 0,
+    }
+    return report, stats
+
+
+def _scan_regions(world_folder: Path) -> tuple[IntegrityReport, dict]:
+    """
+    Walk a world's region files once, producing both the integrity report
+    and the world stats.
+
+    Args:
+        world_folder: Path to the world folder
+
+    Returns:
+        Tuple of (IntegrityReport, stats dictionary)
+    """
+    report, stats = _new_scan(world_folder)
+    for _ in _iter_scan(world_folder, report, stats):
+        pass
+    return report, stats
+
+
+def iter_world_integrity_issues(
+    world_folder: Path, report: IntegrityReport
+) -> Iterator[RegionFileIssue]:
+    """
+    Check the integrity of a Minecraft world, yielding issues as found.
+
+    Args:
+        world_folder: Path to the world folder
+        report: Empty IntegrityReport for this world; holds the totals
+            and any error once the iterator is exhausted
+
+    Yields:
+        Each RegionFileIssue as soon as its file has been checked
+    """
+    _, stats = _new_scan(world_folder)
+    yield from _iter_scan(world_folder, report, stats)
+    _log_report(report)
+
+
 def check_world_integrity(world_folder: Path) -> IntegrityReport:
     """
     Check the integrity of a Minecraft world.
@@ -161,91 +295,111 @@ def check_world_integrity(world_folder: Path) -> IntegrityReport:
     Returns:
         IntegrityReport with findings
     """
-    logger = get_logger()
-    report = IntegrityReport(world_folder=world_folder)
+    report, _ = _scan_regions(world_folder)
+    _log_report(report)
+    return report
 
-    if not world_folder.exists():
-        report.error = "World folder does not exist"
-        return report
 
-    # Find all region folders
-    region_folders = find_region_folders(world_folder)
+def _log_report(report: IntegrityReport) -> None:
+    """Log the findings of an integrity scan."""
+    logger = get_logger()
 
-    if not region_folders:
+    if report.error and report.world_folder.exists():
         logger.warning("No region folders found in world")
-        report.error = "No region folders found (world may be empty or invalid)"
-        return report
-
-    # Scan all region files
-    for region_folder in region_folders:
-        for mca_file in region_folder.glob("*.mca"):
-            report.total_files += 1
-            report.checked_files += 1
+        return
 
-            issue = check_region_file(mca_file)
-            if issue:
-                report.issues.append(issue)
-                logger.warning(f"Issue found: {issue}")
+    for issue in report.issues:
+        logger.warning(f"Issue found: {issue}")
 
     logger.debug(f"Checked {report.checked_files} region files, found {len(report.issues)} issues")
-    return report
+
+
+def _issue_bullets() -> dict:
+    """Map each issue color to its precolored bullet."""
+    return {color: Colors.wrap('•', color) for color in (Colors.RED, Colors.YELLOW)}
+
+
+def _format_issue(issue: RegionFileIssue, bullets: dict) -> list[str]:
+    """Format one issue as report lines."""
+    issue_color = Colors.RED if issue.issue_type == "zero_byte" else Colors.YELLOW
+    return [
+        f"  {bullets[issue_color]} {issue.file.name}",
+        f"    Type: {issue.issue_type}",
+        f"    {issue.details}",
+        "",
+    ]
+
+
+def _summary_lines(report: IntegrityReport) -> list[str]:
+    """Format the verdict and totals of a report."""
+    if report.error:
+        return [
+            f"\n{Colors.error('World Integrity Check: ERROR')}",
+            f"  {report.error}",
+        ]
+    if report.is_healthy:
+        return [
+            f"\n{Colors.success('World Integrity Check: PASSED')}",
+            f"  Checked {report.checked_files} region files",
+            "  No issues found",
+        ]
+    return [
+        f"\n{Colors.warning('World Integrity Check: ISSUES FOUND')}",
+        f"  Checked {report.checked_files} region files",
+        f"  Found {len(report.issues)} issues",
+    ]
 
 
 def print_integrity_report(report: IntegrityReport) -> None:
     """
     Print a formatted integrity report to the console.
 
+    The report is assembled first and written with a single print, so a
+    world with many damaged files doesn't cost a write per line.
+
     Args:
         report: IntegrityReport to print
     """
-    if report.error:
-        print(f"\n{Colors.error('World Integrity Check: ERROR')}")
-        print(f"  {report.error}")
-        return
-
-    if report.is_healthy:
-        print(f"\n{Colors.success('World Integrity Check: PASSED')}")
-        print(f"  Checked {report.checked_files} region files")
-        print("  No issues found")
-    else:
-        print(f"\n{Colors.warning('World Integrity Check: ISSUES FOUND')}")
-        print(f"  Checked {report.checked_files} region files")
-        print(f"  Found {len(report.issues)} issues:\n")
-
+    lines = _summary_lines(report)
+    if report.issues and not report.error:
+        lines[-1] += ":\n"
+        bullets = _issue_bullets()
         for issue in report.issues:
-            issue_color = Colors.RED if issue.issue_type == "zero_byte" else Colors.YELLOW
-            print(f"  {Colors.wrap('•', issue_color)} {issue.file.name}")
-            print(f"    Type: {issue.issue_type}")
-            print(f"    {issue.details}")
-            print()
+            lines.extend(_format_issue(issue, bullets))
 
+    print("\n".join(lines))
 
-def get_world_stats(world_folder: Path) -> dict:
+
+def stream_integrity_report(world_folder: Path) -> IntegrityReport:
     """
-    Get basic statistics about a world.
+    Check a world and print each issue as soon as it is found.
+
+    Unlike check_world_integrity followed by print_integrity_report, output
+    starts with the first damaged file rather than after the whole scan;
+    the verdict and totals follow once the scan is done.
+
+    Args:
+        world_folder: Path to the world folder
 
     Returns:
-        Dictionary with world stats
+        IntegrityReport with findings
     """
-    stats = {
-        'exists': world_folder.exists(),
-        'region_folders': 0,
-        'region_files': 0,
-        'total_size': 0,
-    }
+    report = IntegrityReport(world_folder=world_folder)
+    bullets = _issue_bullets()
+    for issue in iter_world_integrity_issues(world_folder, report):
+        print("\n".join(_format_issue(issue, bullets)))
 
-    if not world_folder.exists():
-        return stats
+    print("\n".join(_summary_lines(report)))
+    return report
 
-    region_folders = find_region_folders(world_folder)
-    stats['region_folders'] = len(region_folders)
 
-    for region_folder in region_folders:
-        for mca_file in region_folder.glob("*.mca"):
-            stats['region_files'] += 1
-            try:
-                stats['total_size'] += mca_file.stat().st_size
-            except OSError:
-                pass
+def get_world_stats(world_folder: Path) -> dict:
+    """
+    Get basic statistics about a world.
 
+    Returns:
+        Dictionary with world stats
+    """
+    _, stats = _scan_regions(world_folder)
     return stats
+
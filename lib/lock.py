@@ -5,6 +5,7 @@ Handles creating, reading, updating, and validating lock files,
 as well as the background heartbeat thread.
 """
 
+import json
 import os
 import threading
 import time
@@ -14,12 +15,22 @@ from typing import Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from .utils import get_hostname, get_timestamp, timestamp_age_seconds, get_logger
 
 
 @dataclass
 class LockInfo:
     """Information from a lock file."""
+    # Declared by hand, as dataclass(slots=True) needs Python 3.10+ and the
+    # wrapper still runs on 3.9
+    _FIELDS = ('hostname', 'started_at', 'last_heartbeat', 'pid')
+    __slots__ = _FIELDS
+
     hostname: str
     started_at: str
     last_heartbeat: str
@@ -46,13 +57,8 @@ class LockInfo:
             return float('inf')
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for YAML serialization."""
-        return {
-            'hostname': self.hostname,
-            'started_at': self.started_at,
-            'last_heartbeat': self.last_heartbeat,
-            'pid': self.pid,
-        }
+        """Convert to dictionary for serialization."""
+        return {name: getattr(self, name) for name in self._FIELDS}
 
     @classmethod
     def from_dict(cls, data: dict) -> 'LockInfo':
@@ -73,6 +79,10 @@ class LockError(Exception):
 class LockManager:
     """Manages the server lock file and heartbeat."""
 
+    # Heartbeats normally rewrite the lock from memory; every this many
+    # heartbeats the file is re-read to catch external changes
+    VERIFY_EVERY = 10
+
     def __init__(self, lock_file: Path, heartbeat_interval: int = 30, stale_threshold: int = 60):
         """
         Initialize the lock manager.
@@ -91,6 +101,12 @@ class LockManager:
         self._heartbeat_stop = threading.Event()
         self._lock_held = False
 
+        # Contents of the lock we hold, so heartbeats don't need to re-read it
+        self._lock_info: Optional[LockInfo] = None
+        self._heartbeats_since_verify = 0
+        # (inode, mtime) of the lock file as we last wrote it
+        self._written_stat: Optional[tuple[int, int]] = None
+
     def read_lock(self) -> Optional[LockInfo]:
         """
         Read the current lock file.
@@ -98,26 +114,58 @@ class LockManager:
         Returns:
             LockInfo if lock exists and is valid, None otherwise
         """
-        if not self.lock_file.exists():
-            return None
-
         try:
             with open(self.lock_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-
-            if not data or not isinstance(data, dict):
-                self.logger.warning("Lock file exists but is empty or invalid")
-                return None
-
-            return LockInfo.from_dict(data)
-
-        except yaml.YAMLError as e:
-            self.logger.error(f"Lock file has invalid YAML: {e}")
+                content = f.read()
+        except FileNotFoundError:
             return None
         except OSError as e:
             self.logger.error(f"Could not read lock file: {e}")
             return None
 
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError:
+            # Lock files written by older versions are YAML
+            try:
+                data = yaml.load(content, Loader=_YamlLoader)
+            except yaml.YAMLError as e:
+                self.logger.error(f"Lock file has invalid YAML: {e}")
+                return None
+
+        if not data or not isinstance(data, dict):
+            self.logger.warning("Lock file exists but is empty or invalid")
+            return None
+
+        return LockInfo.from_dict(data)
+
+    def _write_lock_info_atomic(self, lock_info: LockInfo) -> None:
+        """
+        Write lock info to the lock file atomically.
+
+        The data is written to a temporary file that then replaces the lock
+        file, so Syncthing and other readers never see a half-written lock.
+        JSON is also valid YAML, so older versions can still read it.
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        # Syncthing never syncs files named like its own temporaries, so the
+        # other machine can't pick up the temp file mid-write
+        tmp_file = self.lock_file.with_name(f".syncthing.{self.lock_file.name}.tmp")
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(lock_info.to_dict(), f, indent=2)
+            os.replace(tmp_file, self.lock_file)
+            st = os.stat(self.lock_file)
+            self._written_stat = (st.st_ino, st.st_mtime_ns)
+        except OSError:
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+            raise
+
     def write_lock(self, pid: int) -> bool:
         """
         Write a new lock file.
@@ -137,10 +185,11 @@ class LockManager:
         )
 
         try:
-            with open(self.lock_file, 'w', encoding='utf-8') as f:
-                yaml.dump(lock_info.to_dict(), f, default_flow_style=False)
+            self._write_lock_info_atomic(lock_info)
 
             self._lock_held = True
+            self._lock_info = lock_info
+            self._heartbeats_since_verify = 0
             self.logger.debug(f"Wrote lock file: {self.lock_file}")
             return True
 
@@ -152,23 +201,40 @@ class LockManager:
         """
         Update the heartbeat timestamp in the lock file.
 
+        Ownership is verified when the lock is written; after that the lock
+        is rewritten from memory as long as the file is still the one we
+        wrote (same inode and mtime). Otherwise, and every VERIFY_EVERY
+        heartbeats, the file is re-read to detect it being removed or taken over.
+
         Returns:
             True if successful
         """
-        lock_info = self.read_lock()
-        if not lock_info:
-            self.logger.error("Cannot update heartbeat: lock file missing")
-            return False
+        lock_info = self._lock_info
+        self._heartbeats_since_verify += 1
 
-        if not lock_info.is_own_machine():
-            self.logger.error("Cannot update heartbeat: lock owned by different machine")
-            return False
+        try:
+            st = os.stat(self.lock_file)
+            unchanged = (st.st_ino, st.st_mtime_ns) == self._written_stat
+        except OSError:
+            unchanged = False
+
+        if lock_info is None or not unchanged or self._heartbeats_since_verify >= self.VERIFY_EVERY:
+            lock_info = self.read_lock()
+            if not lock_info:
+                self.logger.error("Cannot update heartbeat: lock file missing")
+                return False
+
+            if not lock_info.is_own_machine():
+                self.logger.error("Cannot update heartbeat: lock owned by different machine")
+                return False
+
+            self._lock_info = lock_info
+            self._heartbeats_since_verify = 0
 
         lock_info.last_heartbeat = get_timestamp()
 
         try:
-            with open(self.lock_file, 'w', encoding='utf-8') as f:
-                yaml.dump(lock_info.to_dict(), f, default_flow_style=False)
+            self._write_lock_info_atomic(lock_info)
             return True
         except OSError as e:
             self.logger.error(f"Could not update heartbeat: {e}")
@@ -181,18 +247,19 @@ class LockManager:
         Returns:
             True if successful or file didn't exist
         """
-        if not self.lock_file.exists():
-            return True
-
         try:
             self.lock_file.unlink()
-            self._lock_held = False
-            self.logger.info("Deleted lock file")
+        except FileNotFoundError:
             return True
         except OSError as e:
             self.logger.error(f"Could not delete lock file: {e}")
             return False
 
+        self._lock_held = False
+        self._lock_info = None
+        self.logger.info("Deleted lock file")
+        return True
+
     def check_lock_status(self) -> tuple[str, Optional[LockInfo]]:
         """
         Check the current lock status and determine appropriate action.
@@ -258,8 +325,10 @@ class LockManager:
                 f"Race condition detected! Lock now owned by {lock_info.hostname}"
             )
             self._lock_held = False
+            self._lock_info = None
             return False
 
+        self._lock_info = lock_info
         self.logger.info("Lock verified after race wait")
         return True
 
@@ -294,11 +363,19 @@ class LockManager:
 
     def _heartbeat_loop(self) -> None:
         """Background thread that updates the heartbeat periodically."""
-        while not self._heartbeat_stop.wait(timeout=self.heartbeat_interval):
+        # Schedule against fixed deadlines so slow writes don't add drift
+        deadline = time.monotonic() + self.heartbeat_interval
+        while not self._heartbeat_stop.wait(timeout=max(0.0, deadline - time.monotonic())):
             if not self.update_heartbeat():
                 self.logger.error("Heartbeat update failed")
                 # Continue trying - don't want to stop just because one update failed
 
+            deadline += self.heartbeat_interval
+            now = time.monotonic()
+            if deadline <= now:
+                # Fell a whole interval behind (stalled disk); don't burst to catch up
+                deadline = now + self.heartbeat_interval
+
     @property
     def is_locked(self) -> bool:
         """Check if we currently hold the lock."""
@@ -306,9 +383,6 @@ class LockManager:
 
     def get_raw_contents(self) -> Optional[str]:
         """Get the raw contents of the lock file for debugging."""
-        if not self.lock_file.exists():
-            return None
-
         try:
             with open(self.lock_file, 'r', encoding='utf-8') as f:
                 return f.read()
@@ -5,9 +5,12 @@ Handles CLI parsing, startup/shutdown sequences, and signal handling.
 """
 
 import argparse
+import functools
 import os
 import signal
-import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -15,54 +18,106 @@ from .config import Config, ConfigError, load_config, validate_config
 from .syncthing import SyncthingClient, SyncthingError, SyncthingUnavailable
 from .lock import LockManager, LockInfo
 from .backup import BackupManager, BackupError
-from .integrity import check_world_integrity, print_integrity_report
+from .integrity import stream_integrity_report
 from .server import MinecraftServer, ServerError
 from .console import Console
 from .utils import (
     setup_logging, get_logger, get_hostname, Colors,
-    confirm_action, choose_option, format_duration
+    confirm_action, choose_option, format_duration, format_size
 )
 
 
+# Signals that ask the wrapper to stop (SIGHUP is missing on Windows)
+STOP_SIGNALS = tuple(
+    getattr(signal, name) for name in ("SIGINT", "SIGTERM", "SIGHUP")
+    if hasattr(signal, name)
+)
+
+
+def _install_signal_handlers(handler) -> dict:
+    """
+    Install a handler for every stop signal.
+
+    Args:
+        handler: Signal handler, or a signal disposition such as SIG_DFL
+
+    Returns:
+        Mapping of signal number to the handler it replaced
+    """
+    return {signum: signal.signal(signum, handler) for signum in STOP_SIGNALS}
+
+
+def _early_signal_handler(signum, frame):
+    """Abort on a stop signal received before the Wrapper installs its own."""
+    raise KeyboardInterrupt
+
+
 class Wrapper:
     """Main wrapper orchestration class."""
 
+    # Seconds between propagation checks while waiting out race_wait
+    RACE_POLL_INTERVAL = 0.5
+
+    # Seconds the folder status fetched during preflight stays usable
+    PREFLIGHT_STATUS_TTL = 2.0
+
     def __init__(self, config: Config):
         self.config = config
         self.logger = get_logger()
 
-        # Initialize components
-        self.syncthing = SyncthingClient(
-            url=config.syncthing.url,
-            api_key=config.syncthing.api_key,
-            folder_id=config.syncthing.folder_id,
-        )
+        self._syncthing_paused = False
+        self._shutdown_in_progress = False
 
-        self.lock_manager = LockManager(
-            lock_file=config.lock_file,
-            heartbeat_interval=config.safety.heartbeat_interval,
-            stale_threshold=config.safety.stale_threshold,
+        # Set by the signal handler; checked by the main flow at safe points
+        self._stop_requested = threading.Event()
+        self._console: Optional[Console] = None
+        # True while the main thread waits in a startup prompt (see _ask)
+        self._at_prompt = False
+
+    # Components are created on first use, so commands such as --status
+    # and --backup only build the parts they need
+
+    @functools.cached_property
+    def syncthing(self) -> SyncthingClient:
+        """Syncthing API client."""
+        return SyncthingClient(
+            url=self.config.syncthing.url,
+            api_key=self.config.syncthing.api_key,
+            folder_id=self.config.syncthing.folder_id,
         )
 
-        self.backup_manager = BackupManager(
-            backup_folder=config.backup.folder,
-            world_folder=config.world_folder,
-            auto_prune=config.backup.auto_prune,
-            keep_minimum=config.backup.keep_minimum,
-            keep_days=config.backup.keep_days,
+    @functools.cached_property
+    def lock_manager(self) -> LockManager:
+        """Lock file manager."""
+        return LockManager(
+            lock_file=self.config.lock_file,
+            heartbeat_interval=self.config.safety.heartbeat_interval,
+            stale_threshold=self.config.safety.stale_threshold,
         )
 
-        self.server = MinecraftServer(
-            server_folder=config.server.folder,
-            jar_name=config.server.jar_name,
-            java_path=config.server.java_path,
-            min_memory=config.server.min_memory,
-            max_memory=config.server.max_memory,
-            extra_args=config.server.extra_args,
+    @functools.cached_property
+    def backup_manager(self) -> BackupManager:
+        """World backup manager."""
+        return BackupManager(
+            backup_folder=self.config.backup.folder,
+            world_folder=self.config.world_folder,
+            auto_prune=self.config.backup.auto_prune,
+            keep_minimum=self.config.backup.keep_minimum,
+            keep_days=self.config.backup.keep_days,
+            compression_level=self.config.backup.compression_level,
         )
 
-        self._syncthing_paused = False
-        self._shutdown_in_progress = False
+    @functools.cached_property
+    def server(self) -> MinecraftServer:
+        """Minecraft server process manager."""
+        return MinecraftServer(
+            server_folder=self.config.server.folder,
+            jar_name=self.config.server.jar_name,
+            java_path=self.config.server.java_path,
+            min_memory=self.config.server.min_memory,
+            max_memory=self.config.server.max_memory,
+            extra_args=self.config.server.extra_args,
+        )
 
     def preflight_checks(self) -> bool:
         """
@@ -74,55 +129,87 @@ class Wrapper:
         print(f"\n{Colors.info('Running pre-flight checks...')}")
         all_ok = True
 
+        # Results are collected and printed in one go at the end
+        lines: list[str] = []
+
         # Check server folder
         if not self.config.server.folder.exists():
-            print(f"  {Colors.error('✗')} Server folder not found: {self.config.server.folder}")
+            print(f"  {Colors.FAIL} Server folder not found: {self.config.server.folder}")
             return False
-        print(f"  {Colors.success('✓')} Server folder: {self.config.server.folder}")
+        lines.append(f"  {Colors.OK} Server folder: {self.config.server.folder}")
+
+        # Only the Java and Syncthing probes are slow (a subprocess and a
+        # network round-trip), so only they go to the pool; the JAR check
+        # is a single stat and runs inline while they work
+        executor = ThreadPoolExecutor(max_workers=2)
+        java_future = executor.submit(self.server.check_java)
+        syncthing_future = (
+            executor.submit(self._probe_syncthing) if self.syncthing.enabled else None
+        )
+        executor.shutdown(wait=False)
 
         # Check server JAR
         jar_ok, jar_msg = self.server.check_jar()
         if jar_ok:
-            print(f"  {Colors.success('✓')} {jar_msg}")
+            lines.append(f"  {Colors.OK} {jar_msg}")
         else:
-            print(f"  {Colors.error('✗')} {jar_msg}")
+            lines.append(f"  {Colors.FAIL} {jar_msg}")
             all_ok = False
 
         # Check Java
-        java_ok, java_msg = self.server.check_java()
+        java_ok, java_msg = java_future.result()
         if java_ok:
-            print(f"  {Colors.success('✓')} Java: {java_msg}")
+            lines.append(f"  {Colors.OK} Java: {java_msg}")
         else:
-            print(f"  {Colors.error('✗')} {java_msg}")
+            lines.append(f"  {Colors.FAIL} {java_msg}")
             all_ok = False
 
         # Check backup folder
         if not self.config.backup.folder.exists():
             try:
                 self.config.backup.folder.mkdir(parents=True)
-                print(f"  {Colors.success('✓')} Created backup folder: {self.config.backup.folder}")
+                lines.append(f"  {Colors.OK} Created backup folder: {self.config.backup.folder}")
             except OSError as e:
-                print(f"  {Colors.error('✗')} Cannot create backup folder: {e}")
+                lines.append(f"  {Colors.FAIL} Cannot create backup folder: {e}")
                 all_ok = False
         else:
-            print(f"  {Colors.success('✓')} Backup folder: {self.config.backup.folder}")
+            lines.append(f"  {Colors.OK} Backup folder: {self.config.backup.folder}")
 
         # Check Syncthing - REQUIRED for safe operation
-        if self.syncthing.check_connection():
-            print(f"  {Colors.success('✓')} Syncthing: Connected to {self.config.syncthing.url}")
+        if syncthing_future is not None and syncthing_future.result():
+            lines.append(f"  {Colors.OK} Syncthing: Connected to {self.config.syncthing.url}")
         else:
-            print(f"  {Colors.error('✗')} Syncthing: Not reachable at {self.config.syncthing.url}")
-            print(f"  {Colors.error('Cannot start without Syncthing for lock coordination')}")
+            lines.append(f"  {Colors.FAIL} Syncthing: Not reachable at {self.config.syncthing.url}")
+            lines.append(f"  {Colors.error('Cannot start without Syncthing for lock coordination')}")
             all_ok = False
 
         # Config validation warnings
         warnings = validate_config(self.config)
         for warning in warnings:
-            print(f"  {Colors.warning('!')} {warning}")
+            lines.append(f"  {Colors.WARN} {warning}")
 
-        print()
+        lines.append("")
+        print("\n".join(lines))
         return all_ok
 
+    def _probe_syncthing(self) -> bool:
+        """
+        Check the Syncthing connection and prefetch the folder status.
+
+        The status is kept by the client, so check_sync_status can reuse it
+        instead of making another request right after preflight.
+
+        Returns:
+            True if Syncthing is reachable
+        """
+        if not self.syncthing.check_connection():
+            return False
+        try:
+            self.syncthing.get_folder_status()
+        except SyncthingError:
+            pass  # check_sync_status will fetch and report it
+        return True
+
     def check_sync_status(self) -> bool:
         """
         Check Syncthing sync status and wait if needed.
@@ -131,7 +218,7 @@ class Wrapper:
             True if OK to proceed
         """
         try:
-            status = self.syncthing.get_folder_status()
+            status = self.syncthing.get_folder_status(max_age=self.PREFLIGHT_STATUS_TTL)
 
             if status.is_synced:
                 self.logger.info("Syncthing folder is up to date")
@@ -146,8 +233,13 @@ class Wrapper:
 
             if status.is_syncing:
                 print(f"[mc-server] Syncthing is currently syncing...")
-                if self.syncthing.wait_for_sync(timeout=self.config.safety.sync_wait_timeout):
+                if self.syncthing.wait_for_sync(
+                    timeout=self.config.safety.sync_wait_timeout,
+                    stop=self._stop_requested
+                ):
                     return True
+                elif self._startup_interrupted():
+                    return False
                 else:
                     print(f"\n[mc-server] {Colors.error('Sync wait timed out')}")
                     print(f"[mc-server] {Colors.error('Cannot start without sync completion')}")
@@ -201,24 +293,27 @@ class Wrapper:
 
     def _handle_own_crash(self, lock_info: LockInfo) -> bool:
         """Handle recovery from our own crash."""
-        print(f"\n{Colors.warning('Detected unclean shutdown from previous session')}")
-        print(f"  Started:   {lock_info.started_at}")
-        print(f"  Last seen: {lock_info.last_heartbeat}")
+        print(
+            f"\n{Colors.warning('Detected unclean shutdown from previous session')}\n"
+            f"  Started:   {lock_info.started_at}\n"
+            f"  Last seen: {lock_info.last_heartbeat}\n"
+            f"\n{Colors.info('Running world integrity check...')}"
+        )
 
         # Run integrity check
-        print(f"\n{Colors.info('Running world integrity check...')}")
-        report = check_world_integrity(self.config.world_folder)
-        print_integrity_report(report)
+        report = stream_integrity_report(self.config.world_folder)
 
         if report.has_issues:
             print(f"\n{Colors.warning('World may have corruption.')}")
-            choice = choose_option(
+            choice = self._ask(
+                choose_option,
                 "What would you like to do?",
                 [
                     "Recover: Clean up lock and proceed with startup",
                     "Restore: Restore from a backup before starting",
                     "Abort: Exit without changes",
-                ]
+                ],
+                cancel=None
             )
 
             if choice == 0:  # Recover
@@ -232,12 +327,14 @@ class Wrapper:
             else:  # Abort or cancel
                 return False
         else:
-            choice = choose_option(
+            choice = self._ask(
+                choose_option,
                 "World appears healthy. What would you like to do?",
                 [
                     "Recover: Clean up lock and proceed with startup",
                     "Abort: Exit without changes",
-                ]
+                ],
+                cancel=None
             )
 
             if choice == 0:  # Recover
@@ -248,27 +345,30 @@ class Wrapper:
 
     def _handle_other_crash(self, lock_info: LockInfo) -> bool:
         """Handle recovery when another machine crashed."""
-        print(f"\n{Colors.warning('Another machine appears to have crashed')}")
-        print(f"  Hostname: {lock_info.hostname}")
-        print(f"  Started:  {lock_info.started_at}")
-        print(f"  Last seen: {lock_info.last_heartbeat} ({lock_info.heartbeat_age():.0f}s ago)")
+        print(
+            f"\n{Colors.warning('Another machine appears to have crashed')}\n"
+            f"  Hostname: {lock_info.hostname}\n"
+            f"  Started:  {lock_info.started_at}\n"
+            f"  Last seen: {lock_info.last_heartbeat} ({lock_info.heartbeat_age():.0f}s ago)\n"
+            f"\n{Colors.info('Running world integrity check...')}"
+        )
 
         # Run integrity check
-        print(f"\n{Colors.info('Running world integrity check...')}")
-        report = check_world_integrity(self.config.world_folder)
-        print_integrity_report(report)
+        report = stream_integrity_report(self.config.world_folder)
 
-        if not confirm_action("\nTake over and start the server?"):
+        if not self._ask(confirm_action, "\nTake over and start the server?", cancel=False):
             return False
 
         if report.has_issues:
-            choice = choose_option(
+            choice = self._ask(
+                choose_option,
                 "World has issues. What would you like to do?",
                 [
                     "Continue: Proceed with current world",
                     "Restore: Restore from a backup first",
                     "Abort: Exit without changes",
-                ]
+                ],
+                cancel=None
             )
 
             if choice == 0:  # Continue
@@ -295,13 +395,17 @@ class Wrapper:
 
         self.backup_manager.print_backup_list()
 
+        answer = self._ask(input, "Enter backup number to restore (0 to cancel): ", cancel=None)
+        if answer is None:
+            return False
+
         try:
-            choice = int(input("Enter backup number to restore (0 to cancel): "))
+            choice = int(answer)
             if choice == 0:
                 return False
             if 1 <= choice <= len(backups):
                 backup = backups[choice - 1]
-                if confirm_action(f"Restore backup from {backup.timestamp}?"):
+                if self._ask(confirm_action, f"Restore backup from {backup.timestamp}?", cancel=False):
                     self.backup_manager.restore_backup(backup)
                     return True
             else:
@@ -314,31 +418,62 @@ class Wrapper:
             print(f"{Colors.error('Restore failed:')} {e}")
             return False
 
-    def pre_start_backup(self) -> bool:
+    def start_pre_start_backup(self) -> Future:
         """
-        Create pre-start backup if world changed.
+        Start the pre-start backup (if the world changed) in the background.
+
+        The backup runs quietly, as acquire_lock prints alongside it;
+        finish_pre_start_backup reports the outcome.
 
         Returns:
-            True if successful (or no backup needed)
+            Future resolving to a (summary, error) tuple from the worker
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pre-start-backup")
+        future = executor.submit(self._pre_start_backup_worker)
+        executor.shutdown(wait=False)
+        return future
+
+    def _pre_start_backup_worker(self) -> tuple[Optional[str], Optional[BackupError]]:
+        """
+        Create the pre-start backup if needed, without printing.
+
+        Returns:
+            Tuple of (summary line to print or None, BackupError if the backup failed)
         """
         if not self.config.world_folder.exists():
             self.logger.info("No world folder yet, skipping pre-start backup")
-            return True
+            return None, None
 
-        if self.backup_manager.world_changed_since_backup():
-            print(f"[mc-server] World has changed since last backup")
-            try:
-                self.backup_manager.create_backup()
-                return True
-            except BackupError as e:
-                print(f"[mc-server] {Colors.error('Backup failed:')} {e}")
-                if not confirm_action("Continue without backup?"):
-                    return False
-                return True
-        else:
-            print(f"[mc-server] World unchanged since last backup, skipping")
+        if not self.backup_manager.world_changed_since_backup():
+            return "World unchanged since last backup, skipping", None
+
+        self.logger.info("World has changed since last backup")
+        try:
+            backup = self.backup_manager.create_backup(quiet=True)
+        except BackupError as e:
+            return None, e
+        return f"Pre-start backup created: {backup.name} ({format_size(backup.size)})", None
+
+    def finish_pre_start_backup(self, future: Future) -> bool:
+        """
+        Wait for the pre-start backup and handle a failure.
+
+        Args:
+            future: Future returned by start_pre_start_backup
+
+        Returns:
+            True if successful (or no backup needed, or the user chose to
+            continue without one)
+        """
+        summary, error = future.result()
+        if summary:
+            print(f"[mc-server] {summary}")
+        if error is None:
             return True
 
+        print(f"[mc-server] {Colors.error('Backup failed:')} {error}")
+        return self._ask(confirm_action, "Continue without backup?", cancel=False)
+
     def pause_syncthing(self) -> bool:
         """Pause Syncthing sync."""
         if self.syncthing.pause_folder():
@@ -369,8 +504,6 @@ class Wrapper:
         Returns:
             True if lock acquired
         """
-        import time
-
         # We don't have PID yet, use 0 as placeholder
         # We'll update it after server starts
         if not self.lock_manager.write_lock(pid=0):
@@ -385,17 +518,53 @@ class Wrapper:
             self.lock_manager.delete_lock()
             return False
 
-        print(f"[mc-server] Created lock file, waiting {self.config.safety.race_wait}s for sync...")
-        time.sleep(self.config.safety.race_wait)
+        # Wait for the lock file to propagate, finishing early once every
+        # device has it and there is nothing left to pull. A lock the other
+        # machine wrote at the same time only shows up once its watcher has
+        # scanned it, so being in sync counts only after the watcher delay
+        # (assumed to match ours); without one, the full race_wait applies.
+        race_wait = self.config.safety.race_wait
+        print(f"[mc-server] Created lock file, waiting up to {race_wait}s for sync...")
+        started = time.monotonic()
+        deadline = started + race_wait
+        watcher_delay = self.syncthing.get_watcher_delay()
+        early_exit_at = deadline if watcher_delay is None else started + min(watcher_delay, race_wait)
+        while True:
+            now = time.monotonic()
+            remaining = deadline - now
+            if remaining <= 0:
+                break
+            if now >= early_exit_at and self.syncthing.is_synced_with_remotes():
+                print(f"[mc-server] Lock file reached all devices")
+                break
+            # Waiting on the stop event lets a signal end the wait at once
+            if self._stop_requested.wait(min(self.RACE_POLL_INTERVAL, remaining)):
+                self._startup_interrupted()
+                self.lock_manager.delete_lock()
+                return False
 
         # Wait for Syncthing to finish syncing the lock file to/from other devices
         print(f"[mc-server] Waiting for Syncthing to finish syncing lock file...")
-        if not self.syncthing.wait_for_sync(timeout=30, poll_interval=2):
-            print(f"[mc-server] {Colors.error('Lock file sync failed')}")
+        if not self.syncthing.wait_for_sync(timeout=30, poll_interval=2, stop=self._stop_requested):
+            if not self._startup_interrupted():
+                print(f"[mc-server] {Colors.error('Lock file sync failed')}")
             self.lock_manager.delete_lock()
             return False
 
         # Re-read to check for race condition
+        if not self.verify_lock():
+            return False
+
+        print(f"[mc-server] Lock verified")
+        return True
+
+    def verify_lock(self) -> bool:
+        """
+        Re-read the lock file and check it is still ours.
+
+        Returns:
+            True if the lock exists and belongs to this machine
+        """
         lock_info = self.lock_manager.read_lock()
 
         if lock_info is None:
@@ -406,7 +575,6 @@ class Wrapper:
             print(f"[mc-server] {Colors.error('Race condition! Lock claimed by')} {lock_info.hostname}")
             return False
 
-        print(f"[mc-server] Lock verified")
         return True
 
     def start_server(self) -> bool:
@@ -457,24 +625,33 @@ class Wrapper:
         # Stop heartbeat
         self.lock_manager.stop_heartbeat()
 
-        # Create post-stop backup
-        if self.config.world_folder.exists():
-            print(f"[mc-server] Creating shutdown backup...")
-            try:
-                self.backup_manager.create_backup()
-            except BackupError as e:
-                print(f"[mc-server] {Colors.warning('Backup failed:')} {e}")
+        # Resuming Syncthing is a network round-trip and the backup is disk
+        # bound, so overlap them. This is safe while the lock still exists:
+        # the other machine can't start a server, so nothing syncs into the
+        # world while it is being archived.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            resume_future = executor.submit(self.resume_syncthing)
+
+            # Create post-stop backup
+            if self.config.world_folder.exists():
+                print(f"[mc-server] Creating shutdown backup...")
+                try:
+                    self.backup_manager.create_backup()
+                except BackupError as e:
+                    print(f"[mc-server] {Colors.warning('Backup failed:')} {e}")
+
+            # Delete lock (only once the backup is finished)
+            self.lock_manager.delete_lock()
 
-        # Delete lock
-        self.lock_manager.delete_lock()
+            # Prune old backups while the lock deletion is pushed out
+            prune_future = executor.submit(self.backup_manager.prune_backups)
 
-        # Prune old backups
-        self.backup_manager.prune_backups()
+            # Trigger a scan once resumed so the lock deletion syncs promptly
+            resume_future.result()
+            if self.syncthing.enabled:
+                self.syncthing.trigger_scan()
 
-        # Resume Syncthing and trigger scan so lock deletion syncs promptly
-        self.resume_syncthing()
-        if self.syncthing.enabled:
-            self.syncthing.trigger_scan()
+            prune_future.result()
 
         # Cleanup
         self.server.cleanup()
@@ -484,6 +661,41 @@ class Wrapper:
 
         return exit_code
 
+    def _ask(self, prompt, *args, cancel):
+        """
+        Run an interactive startup prompt that a stop signal can abort.
+
+        While the prompt waits, the signal handler raises KeyboardInterrupt
+        to leave input(); the prompt then counts as cancelled.
+
+        Args:
+            prompt: Prompt function, such as confirm_action or choose_option
+            *args: Arguments for the prompt function
+            cancel: Value returned if the prompt is aborted by a signal
+
+        Returns:
+            The prompt function's result, or cancel
+        """
+        if self._startup_interrupted():
+            return cancel
+
+        self._at_prompt = True
+        try:
+            return prompt(*args)
+        except KeyboardInterrupt:
+            print()
+            self._startup_interrupted()
+            return cancel
+        finally:
+            self._at_prompt = False
+
+    def _startup_interrupted(self) -> bool:
+        """Check whether a signal asked us to stop while starting up."""
+        if self._stop_requested.is_set():
+            print(f"[mc-server] {Colors.warning('Startup interrupted')}")
+            return True
+        return False
+
     def run_interactive(self) -> int:
         """
         Run the wrapper in interactive mode.
@@ -491,39 +703,59 @@ class Wrapper:
         Returns:
             Exit code
         """
-        # Setup signal handlers
+        # Setup signal handlers. The handler records the request and wakes
+        # whatever is waiting (console, prompt, sync and race waits); the
+        # shutdown itself runs from the main flow below, never from inside
+        # the handler where it could interrupt I/O half-way.
         def signal_handler(signum, frame):
             signame = signal.Signals(signum).name
             print(f"\n[mc-server] Received {signame}")
             self.logger.info(f"Received signal: {signame}")
-            self.shutdown()
-            sys.exit(0)
+            if self._shutdown_in_progress or self._stop_requested.is_set():
+                return
+            self._stop_requested.set()
+            if self._console is not None:
+                self._console.interrupt()
+            elif self._at_prompt:
+                raise KeyboardInterrupt  # Caught by _ask, which cancels the prompt
+            else:
+                print(f"[mc-server] Stopping after the current step...")
 
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-        try:
-            signal.signal(signal.SIGHUP, signal_handler)
-        except AttributeError:
-            pass  # SIGHUP not available on Windows
+        _install_signal_handlers(signal_handler)
 
         # Pre-flight checks
-        if not self.preflight_checks():
+        if not self.preflight_checks() or self._startup_interrupted():
             return 1
 
+        # Finish deleting worlds replaced by an interrupted restore
+        self.backup_manager.cleanup_pending_deletes()
+
         # Check sync status
-        if not self.check_sync_status():
+        if not self.check_sync_status() or self._startup_interrupted():
             return 1
 
         # Handle lock
-        if not self.handle_lock():
+        if not self.handle_lock() or self._startup_interrupted():
             return 1
 
-        # Pre-start backup
-        if not self.pre_start_backup():
-            return 1
+        # Pre-start backup, overlapped with the lock's race wait. The world
+        # can't change meanwhile: sync has settled and the lock shows no
+        # other machine running a server.
+        backup_future = self.start_pre_start_backup()
 
         # Acquire lock (Syncthing must still be running so the lock file syncs)
         if not self.acquire_lock():
+            backup_future.result()  # Let the backup finish before exiting
+            return 1
+
+        if not self.finish_pre_start_backup(backup_future) or self._startup_interrupted():
+            self.lock_manager.delete_lock()
+            return 1
+
+        # The backup (and any prompt after it) may have outlasted the lock
+        # check by minutes while Syncthing kept syncing, so make sure no
+        # other machine has claimed the lock meanwhile
+        if not self.verify_lock():
             return 1
 
         # Pause Syncthing (after lock is verified, so sync is no longer needed)
@@ -537,18 +769,21 @@ class Wrapper:
             self.resume_syncthing()
             return 1
 
-        # Run interactive console
-        console = Console(
-            server=self.server,
-            backup_manager=self.backup_manager,
-            syncthing_client=self.syncthing,
-            on_shutdown=None  # We handle shutdown ourselves
-        )
+        # Run interactive console (unless a signal already asked us to stop)
+        if not self._stop_requested.is_set():
+            self._console = Console(
+                server=self.server,
+                backup_manager=self.backup_manager,
+                syncthing_client=self.syncthing,
+                on_shutdown=None  # We handle shutdown ourselves
+            )
 
-        try:
-            console.start()
-        except Exception as e:
-            self.logger.error(f"Console error: {e}")
+            try:
+                self._console.start()
+            except Exception as e:
+                self.logger.error(f"Console error: {e}")
+            finally:
+                self._console = None
 
         # Shutdown
         return self.shutdown()
@@ -558,46 +793,47 @@ def cmd_status(config: Config) -> int:
     """Show status without starting."""
     wrapper = Wrapper(config)
 
-    print(f"\n{Colors.info('Minecraft Server Wrapper Status')}")
-    print("=" * 50)
+    # Collected and printed in one go at the end
+    lines = [f"\n{Colors.info('Minecraft Server Wrapper Status')}", "=" * 50]
 
     # Lock status
     status, lock_info = wrapper.lock_manager.check_lock_status()
-    print(f"\n{Colors.info('Lock Status:')}")
+    lines.append(f"\n{Colors.info('Lock Status:')}")
     if status == "free":
-        print(f"  Status: {Colors.success('Available')}")
+        lines.append(f"  Status: {Colors.success('Available')}")
     elif status == "owned":
-        print(f"  Status: {Colors.warning('Stale lock (own machine)')}")
-        print(f"  Last seen: {lock_info.last_heartbeat}")
+        lines.append(f"  Status: {Colors.warning('Stale lock (own machine)')}")
+        lines.append(f"  Last seen: {lock_info.last_heartbeat}")
     elif status == "other_active":
-        print(f"  Status: {Colors.error('Running on another machine')}")
-        print(f"  Hostname: {lock_info.hostname}")
-        print(f"  Started: {lock_info.started_at}")
+        lines.append(f"  Status: {Colors.error('Running on another machine')}")
+        lines.append(f"  Hostname: {lock_info.hostname}")
+        lines.append(f"  Started: {lock_info.started_at}")
     elif status == "other_stale":
-        print(f"  Status: {Colors.warning('Stale lock (other machine)')}")
-        print(f"  Hostname: {lock_info.hostname}")
-        print(f"  Last seen: {lock_info.last_heartbeat}")
+        lines.append(f"  Status: {Colors.warning('Stale lock (other machine)')}")
+        lines.append(f"  Hostname: {lock_info.hostname}")
+        lines.append(f"  Last seen: {lock_info.last_heartbeat}")
 
     # Syncthing status
-    print(f"\n{Colors.info('Syncthing:')}")
+    lines.append(f"\n{Colors.info('Syncthing:')}")
     if wrapper.syncthing.enabled:
         try:
             sync_status = wrapper.syncthing.get_folder_status()
-            print(f"  Status: {sync_status}")
-            print(f"  Paused: {wrapper.syncthing.is_folder_paused()}")
+            lines.append(f"  Status: {sync_status}")
+            lines.append(f"  Paused: {wrapper.syncthing.is_folder_paused()}")
         except SyncthingError as e:
-            print(f"  Status: {Colors.error('Error:')} {e}")
+            lines.append(f"  Status: {Colors.error('Error:')} {e}")
     else:
-        print(f"  Status: {Colors.warning('Disabled')}")
+        lines.append(f"  Status: {Colors.warning('Disabled')}")
 
     # Backup status
-    print(f"\n{Colors.info('Backups:')}")
+    lines.append(f"\n{Colors.info('Backups:')}")
     backups = wrapper.backup_manager.list_backups()
-    print(f"  Count: {len(backups)}")
+    lines.append(f"  Count: {len(backups)}")
     if backups:
-        print(f"  Latest: {backups[0].timestamp.strftime('%Y-%m-%d %H:%M')}")
+        lines.append(f"  Latest: {backups[0].timestamp.strftime('%Y-%m-%d %H:%M')}")
 
-    print()
+    lines.append("")
+    print("\n".join(lines))
     return 0
 
 
@@ -653,6 +889,25 @@ def cmd_restore(config: Config) -> int:
 
 def run() -> int:
     """Main entry point."""
+    # Catch stop signals from the very start. Until run_interactive installs
+    # the real handlers they abort at once, which is safe: nothing before
+    # that point has touched the lock, the world or Syncthing.
+    previous_handlers = _install_signal_handlers(_early_signal_handler)
+    try:
+        return _run(previous_handlers)
+    except KeyboardInterrupt:
+        print(f"\n[mc-server] {Colors.warning('Interrupted')}")
+        return 1
+
+
+def _run(previous_handlers: dict) -> int:
+    """
+    Parse arguments, load the config and run the chosen mode.
+
+    Args:
+        previous_handlers: Signal handlers replaced by the early handler,
+            restored for the subcommands
+    """
     parser = argparse.ArgumentParser(
         description="Minecraft Server Wrapper - Safe multi-user server management",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -706,6 +961,11 @@ Examples:
     logger = get_logger()
     logger.info(f"mc-server wrapper starting on {get_hostname()}")
 
+    # Subcommands keep the default signal behaviour
+    if args.status or args.backup or args.restore:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+
     # Handle subcommands
     if args.status:
         return cmd_status(config)
@@ -5,8 +5,11 @@ Handles starting, stopping, and monitoring the Minecraft server process.
 """
 
 import os
+import queue
+import selectors
 import subprocess
 import shutil
+import threading
 import time
 from pathlib import Path
 from typing import Optional, IO
@@ -14,6 +17,10 @@ from typing import Optional, IO
 from .utils import get_logger
 
 
+# Bytes read from the server's stdout pipe per read call
+READ_CHUNK_SIZE = 65536
+
+
 class ServerError(Exception):
     """Server-related error."""
     pass
@@ -50,9 +57,32 @@ class MinecraftServer:
         self.extra_args = extra_args or []
         self.logger = get_logger()
 
+        # The start command only depends on the settings above, so build it
+        # once: heap sizes, extra JVM arguments, then the JAR and nogui flag
+        self._command = [
+            self.java_path,
+            f"-Xms{self.min_memory}",
+            f"-Xmx{self.max_memory}",
+            *self.extra_args,
+            "-jar", os.fspath(self.jar_path),
+            "nogui",
+        ]
+
         self._process: Optional[subprocess.Popen] = None
+        # pidfd for the server process (Linux 5.3+), readable once it exits
+        self._pidfd: Optional[int] = None
+        # Raw fd of the server's stdin, written directly by send_command
+        self._stdin_fd: Optional[int] = None
         self._start_time: Optional[float] = None
 
+        # Successful check_java result; the Java install doesn't change while
+        # the wrapper runs, so it is only probed once
+        self._java_check: Optional[tuple[bool, str]] = None
+
+        # Server output lines, filled by a reader thread. None marks end of output.
+        self.output_queue: queue.Queue[Optional[str]] = queue.Queue()
+        self._reader_thread: Optional[threading.Thread] = None
+
     @property
     def jar_path(self) -> Path:
         """Get the full path to the server JAR."""
@@ -77,24 +107,24 @@ class MinecraftServer:
         """Get server uptime in seconds, if running."""
         if self._start_time is None or not self.is_running:
             return None
-        return time.time() - self._start_time
+        return time.monotonic() - self._start_time
 
     @property
-    def stdin(self) -> Optional[IO]:
-        """Get the server's stdin stream."""
+    def stdin(self) -> Optional[IO[bytes]]:
+        """Get the server's stdin stream (binary, unbuffered)."""
         if self._process is None:
             return None
         return self._process.stdin
 
     @property
-    def stdout(self) -> Optional[IO]:
-        """Get the server's stdout stream."""
+    def stdout(self) -> Optional[IO[bytes]]:
+        """Get the server's stdout stream (binary, unbuffered)."""
         if self._process is None:
             return None
         return self._process.stdout
 
     @property
-    def stderr(self) -> Optional[IO]:
+    def stderr(self) -> Optional[IO[bytes]]:
         """Get the server's stderr stream."""
         if self._process is None:
             return None
@@ -104,9 +134,15 @@ class MinecraftServer:
         """
         Check if Java is installed and get version.
 
+        A successful result is cached, so start() after the preflight check
+        doesn't run `java -version` a second time.
+
         Returns:
             Tuple of (is_available, version_string)
         """
+        if self._java_check is not None:
+            return self._java_check
+
         try:
             result = subprocess.run(
                 [self.java_path, "-version"],
@@ -118,7 +154,8 @@ class MinecraftServer:
             version_output = result.stderr or result.stdout
             # Extract first line which typically contains version
             version_line = version_output.strip().split('\n')[0]
-            return True, version_line
+            self._java_check = (True, version_line)
+            return self._java_check
         except FileNotFoundError:
             return False, f"Java not found at: {self.java_path}"
         except subprocess.TimeoutExpired:
@@ -139,22 +176,7 @@ class MinecraftServer:
 
     def build_command(self) -> list[str]:
         """Build the command to start the server."""
-        cmd = [
-            self.java_path,
-            f"-Xms{self.min_memory}",
-            f"-Xmx{self.max_memory}",
-        ]
-
-        # Add extra JVM arguments
-        cmd.extend(self.extra_args)
-
-        # Add JAR and nogui flag
-        cmd.extend([
-            "-jar", str(self.jar_path),
-            "nogui"
-        ])
-
-        return cmd
+        return list(self._command)
 
     def start(self) -> int:
         """
@@ -189,10 +211,22 @@ class MinecraftServer:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,  # Merge stderr into stdout
                 cwd=self.server_folder,
-                text=True,
-                bufsize=1,  # Line buffered
+                bufsize=0,  # Raw byte pipes; output is decoded by the reader thread
+            )
+            self._start_time = time.monotonic()
+            if self._pidfd is not None:
+                os.close(self._pidfd)  # Left over from a run without cleanup()
+            self._pidfd = self._open_pidfd(self._process.pid)
+            self._stdin_fd = self._process.stdin.fileno()
+
+            self.output_queue = queue.Queue()
+            self._reader_thread = threading.Thread(
+                target=self._read_output,
+                args=(self._process.stdout.fileno(), self.output_queue),
+                name="server-output",
+                daemon=True
             )
-            self._start_time = time.time()
+            self._reader_thread.start()
 
             self.logger.info(f"Server started with PID: {self._process.pid}")
             return self._process.pid
@@ -210,12 +244,14 @@ class MinecraftServer:
         Returns:
             True if command was sent
         """
-        if not self.is_running or self._process is None:
+        if not self.is_running or self._stdin_fd is None:
             return False
 
+        data = f"{command}\n".encode("utf-8")
         try:
-            self._process.stdin.write(command + "\n")
-            self._process.stdin.flush()
+            # A pipe write is only ever partial if a signal interrupts it
+            while data:
+                data = data[os.write(self._stdin_fd, data):]
             self.logger.debug(f"Sent command: {command}")
             return True
         except (OSError, BrokenPipeError) as e:
@@ -247,7 +283,7 @@ class MinecraftServer:
 
         # Wait for process to exit
         try:
-            self._process.wait(timeout=timeout)
+            self._wait_process(timeout)
             self.logger.info("Server stopped gracefully")
             print("[mc-server] Server stopped gracefully")
             return True
@@ -268,7 +304,7 @@ class MinecraftServer:
 
         try:
             self._process.kill()
-            self._process.wait(timeout=5)
+            self._wait_process(5)
             self.logger.info("Server force killed")
             return True
         except subprocess.TimeoutExpired:
@@ -292,47 +328,125 @@ class MinecraftServer:
             return None
 
         try:
-            return self._process.wait(timeout=timeout)
+            return self._wait_process(timeout)
         except subprocess.TimeoutExpired:
             return None
 
-    def read_line(self, timeout: float = 0.1) -> Optional[str]:
+    @staticmethod
+    def _open_pidfd(pid: int) -> Optional[int]:
+        """Open a pidfd for a process, or return None where unsupported."""
+        try:
+            return os.pidfd_open(pid)
+        except (AttributeError, OSError):
+            return None  # Not Linux 5.3+ (or Python < 3.9)
+
+    def _wait_process(self, timeout: Optional[float]) -> int:
         """
-        Read a line from server output (non-blocking).
+        Wait for the server process to exit and reap it.
+
+        With a timeout, Popen.wait polls with short sleeps; when a pidfd is
+        available we block on it instead and are woken as soon as the
+        process exits.
 
         Args:
-            timeout: How long to wait for a line
+            timeout: Maximum time to wait (None = wait forever)
 
         Returns:
-            Line of output, or None if no output available
+            Exit code
+
+        Raises:
+            subprocess.TimeoutExpired: If the process is still running
         """
-        if not self.is_running or self._process is None:
-            return None
+        if timeout is not None and self._pidfd is not None and self._process.returncode is None:
+            with selectors.DefaultSelector() as selector:
+                selector.register(self._pidfd, selectors.EVENT_READ)
+                if not selector.select(timeout):
+                    raise subprocess.TimeoutExpired(self._process.args, timeout)
+            return self._process.wait()
+
+        return self._process.wait(timeout=timeout)
 
-        import select
+    def _read_output(self, stdout_fd: int, output_queue: queue.Queue) -> None:
+        """
+        Background thread that moves server output lines onto the output queue.
 
-        # Check if there's data available to read
+        The pipe is read in large chunks straight from its file descriptor,
+        and each chunk's complete lines are decoded in one go, rather than
+        going through the text wrapper a line at a time.
+        """
+        pending = bytearray()
         try:
-            readable, _, _ = select.select([self._process.stdout], [], [], timeout)
-            if readable:
-                line = self._process.stdout.readline()
-                return line if line else None
-            return None
-        except (ValueError, OSError):
+            while True:
+                chunk = os.read(stdout_fd, READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                pending += chunk
+
+                end = pending.rfind(b"\n")
+                if end < 0:
+                    continue  # No complete line yet
+                text = pending[:end].decode("utf-8", "replace")
+                del pending[:end + 1]
+
+                if "\r" in text:
+                    text = text.replace("\r\n", "\n")
+                for line in text.split("\n"):
+                    output_queue.put(line + "\n")
+        except OSError:
             # stdout closed
+            pass
+        finally:
+            if pending:
+                output_queue.put(pending.decode("utf-8", "replace"))
+            output_queue.put(None)
+
+    def read_line(self, timeout: float = 0.1) -> Optional[str]:
+        """
+        Read a line from server output.
+
+        Args:
+            timeout: How long to wait for a line
+
+        Returns:
+            Line of output, or None if no output arrived in time or output has ended
+        """
+        try:
+            return self.output_queue.get(timeout=timeout)
+        except queue.Empty:
             return None
 
     def cleanup(self) -> None:
         """Clean up the process resources."""
+        if self._process is not None and self._process.stdin:
+            try:
+                self._process.stdin.close()
+            except OSError:
+                pass
+        self._stdin_fd = None
+
+        # The reader thread reads stdout by fd number, so it has to finish
+        # before the pipe is closed (or the number could be reused under
+        # it). It ends on EOF once the server and its children are gone.
+        reader_done = True
+        if self._reader_thread is not None:
+            self._reader_thread.join(timeout=2)
+            reader_done = not self._reader_thread.is_alive()
+            self._reader_thread = None
+
         if self._process is not None:
             try:
-                if self._process.stdin:
-                    self._process.stdin.close()
                 if self._process.stdout:
-                    self._process.stdout.close()
+                    if reader_done:
+                        self._process.stdout.close()
+                    else:
+                        self.logger.warning("Server output reader still running, leaving stdout open")
                 if self._process.stderr:
                     self._process.stderr.close()
             except OSError:
                 pass
             self._process = None
             self._start_time = None
+
+        if self._pidfd is not None:
+            os.close(self._pidfd)
+            self._pidfd = None
@@ -2,18 +2,39 @@
 Syncthing API client for the Minecraft server wrapper.
 
 Handles pausing/resuming folder sync and checking sync status.
-Uses urllib from stdlib to avoid external dependencies.
+Uses http.client from stdlib to avoid external dependencies.
 """
 
+import functools
+import http.client
 import json
+import sys
+import threading
 import time
-import urllib.request
-import urllib.error
-from dataclasses import dataclass
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Any, Optional
 
 from .utils import get_logger
 
+# Prefer orjson when installed: it parses bytes directly and is several times
+# faster than the stdlib parser. Its decode error subclasses the stdlib one.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+
+# Start of the wait_for_sync progress line, which overwrites itself
+PROGRESS_PREFIX = b"\r[mc-server] "
+
 
 class SyncthingError(Exception):
     """Syncthing API error."""
@@ -25,9 +46,15 @@ class SyncthingUnavailable(SyncthingError):
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class FolderStatus:
-    """Status of a Syncthing folder."""
+    """
+    Status of a Syncthing folder.
+
+    Statuses are immutable, since the client caches and hands out the same
+    instance; the derived flags and display text are therefore computed
+    once, when the status is created.
+    """
     state: str  # "idle", "syncing", "scanning", "sync-preparing", etc.
     global_bytes: int
     local_bytes: int
@@ -36,38 +63,55 @@ class FolderStatus:
     errors: int
     pull_errors: int
 
-    @property
-    def is_synced(self) -> bool:
-        """Check if folder is fully synced (idle with nothing needed)."""
-        return self.state == "idle" and self.need_bytes == 0 and self.need_files == 0
-
-    @property
-    def is_syncing(self) -> bool:
-        """Check if folder is actively syncing."""
-        return self.state in ("syncing", "sync-preparing", "sync-waiting")
-
-    @property
-    def has_errors(self) -> bool:
-        """Check if there are sync errors."""
-        return self.errors > 0 or self.pull_errors > 0
-
-    def __str__(self) -> str:
-        if self.is_synced:
-            return "Up to Date"
-        elif self.is_syncing:
+    # Fully synced (idle with nothing needed)
+    is_synced: bool = field(init=False, repr=False, compare=False)
+    # Actively syncing
+    is_syncing: bool = field(init=False, repr=False, compare=False)
+    # There are sync errors
+    has_errors: bool = field(init=False, repr=False, compare=False)
+    _text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        is_synced = self.state == "idle" and self.need_bytes == 0 and self.need_files == 0
+        is_syncing = self.state in ("syncing", "sync-preparing", "sync-waiting")
+        has_errors = self.errors > 0 or self.pull_errors > 0
+
+        if is_synced:
+            text = "Up to Date"
+        elif is_syncing:
             if self.global_bytes > 0:
                 percent = (self.local_bytes / self.global_bytes) * 100
-                return f"Syncing ({percent:.1f}%)"
-            return "Syncing"
-        elif self.has_errors:
-            return f"Error ({self.errors} errors)"
+                text = f"Syncing ({percent:.1f}%)"
+            else:
+                text = "Syncing"
+        elif has_errors:
+            text = f"Error ({self.errors} errors)"
         else:
-            return f"State: {self.state}"
+            text = f"State: {self.state}"
+
+        # The dataclass is frozen, so bypass its __setattr__
+        object.__setattr__(self, "is_synced", is_synced)
+        object.__setattr__(self, "is_syncing", is_syncing)
+        object.__setattr__(self, "has_errors", has_errors)
+        object.__setattr__(self, "_text", text)
+
+    def __str__(self) -> str:
+        return self._text
 
 
 class SyncthingClient:
     """Client for Syncthing REST API."""
 
+    # Seconds a looked-up paused state is reused by is_folder_paused
+    PAUSED_CACHE_TTL = 1.0
+
+    # Event types that signal a change in a folder's sync state
+    SYNC_EVENTS = "StateChanged,FolderSummary"
+
+    # Longest single event long-poll while waiting for sync, so a stop
+    # request is noticed within a few seconds
+    EVENT_POLL_TIMEOUT = 5
+
     def __init__(self, url: str, api_key: str, folder_id: str):
         """
         Initialize Syncthing client.
@@ -83,6 +127,31 @@ class SyncthingClient:
         self.logger = get_logger()
         self._enabled = bool(api_key)
 
+        # (time.monotonic() when fetched, status) of the last folder status
+        self._last_status: Optional[tuple[float, FolderStatus]] = None
+
+        # (time.monotonic() when known, paused) of the folder's paused state
+        self._paused_cache: Optional[tuple[float, bool]] = None
+
+        # Headers are the same for every call, so build them once
+        self._headers = {
+            "X-API-Key": self.api_key,
+            "Content-Type": "application/json",
+        }
+
+        # Keep-alive connections to Syncthing, reused across requests so a
+        # poll doesn't pay for a new TCP (or TLS) handshake every time
+        parts = urllib.parse.urlsplit(self.url)
+        self._connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port
+        self._base_path = parts.path
+        self._idle_connections: list[http.client.HTTPConnection] = []
+        self._connections_lock = threading.Lock()
+
     @property
     def enabled(self) -> bool:
         """Check if Syncthing management is enabled."""
@@ -111,42 +180,82 @@ class SyncthingClient:
             SyncthingUnavailable: If Syncthing is not reachable
             SyncthingError: For other API errors
         """
-        url = f"{self.url}{endpoint}"
+        body = _json_dumps(data) if data else None
 
-        headers = {
-            "X-API-Key": self.api_key,
-            "Content-Type": "application/json",
-        }
+        # A reused connection may have been closed by Syncthing while idle;
+        # that only shows up when it is used, so retry once on a fresh one
+        conn, reused = self._take_connection(timeout)
+        try:
+            try:
+                status, reason, content = self._send(conn, method, endpoint, body)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if not reused:
+                    raise
+                conn.close()
+                conn = self._connection_class(self._host, self._port, timeout=timeout)
+                status, reason, content = self._send(conn, method, endpoint, body)
+        except ConnectionRefusedError:
+            conn.close()
+            raise SyncthingUnavailable(f"Syncthing not reachable at {self.url}")
+        except TimeoutError:
+            conn.close()
+            raise SyncthingUnavailable(f"Connection to Syncthing timed out")
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise SyncthingUnavailable(f"Could not connect to Syncthing: {e}")
 
-        body = json.dumps(data).encode('utf-8') if data else None
+        self._put_connection(conn)
 
-        try:
-            request = urllib.request.Request(
-                url,
-                data=body,
-                headers=headers,
-                method=method
-            )
+        if status != 200:
+            raise SyncthingError(f"API error: {status} {reason}")
 
-            with urllib.request.urlopen(request, timeout=timeout) as response:
-                if response.status == 200:
-                    content = response.read().decode('utf-8')
-                    if content:
-                        return json.loads(content)
-                    return {}
-                else:
-                    raise SyncthingError(f"API returned status {response.status}")
-
-        except urllib.error.URLError as e:
-            if isinstance(e.reason, ConnectionRefusedError):
-                raise SyncthingUnavailable(f"Syncthing not reachable at {self.url}")
-            raise SyncthingUnavailable(f"Could not connect to Syncthing: {e.reason}")
-        except urllib.error.HTTPError as e:
-            raise SyncthingError(f"API error: {e.code} {e.reason}")
+        if not content:
+            return {}
+        try:
+            return _json_loads(content)
         except json.JSONDecodeError as e:
             raise SyncthingError(f"Invalid JSON response: {e}")
-        except TimeoutError:
-            raise SyncthingUnavailable(f"Connection to Syncthing timed out")
+
+    def _take_connection(self, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        """
+        Get an idle connection, or a new one if none is free.
+
+        Returns:
+            Tuple of (connection, whether it was used before)
+        """
+        with self._connections_lock:
+            conn = self._idle_connections.pop() if self._idle_connections else None
+
+        if conn is None:
+            return self._connection_class(self._host, self._port, timeout=timeout), False
+
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _put_connection(self, conn: http.client.HTTPConnection) -> None:
+        """Return a connection to the idle pool for reuse."""
+        with self._connections_lock:
+            self._idle_connections.append(conn)
+
+    def _send(
+        self,
+        conn: http.client.HTTPConnection,
+        method: str,
+        endpoint: str,
+        body: Optional[bytes]
+    ) -> tuple[int, str, bytes]:
+        """
+        Send one request on a connection and read the whole response.
+
+        Returns:
+            Tuple of (status code, reason, response body)
+        """
+        conn.request(method, self._base_path + endpoint, body=body, headers=self._headers)
+        response = conn.getresponse()
+        # The body must be read in full before the connection can be reused
+        return response.status, response.reason, response.read()
 
     def check_connection(self) -> bool:
         """
@@ -164,10 +273,14 @@ class SyncthingClient:
         except SyncthingError:
             return False
 
-    def get_folder_status(self) -> FolderStatus:
+    def get_folder_status(self, max_age: float = 0.0) -> FolderStatus:
         """
         Get the current status of the managed folder.
 
+        Args:
+            max_age: Seconds a previously fetched status may be reused for
+                (0 always queries Syncthing)
+
         Returns:
             FolderStatus object
 
@@ -177,12 +290,17 @@ class SyncthingClient:
         if not self.enabled:
             raise SyncthingError("Syncthing management is disabled (no API key)")
 
+        if max_age > 0 and self._last_status is not None:
+            fetched_at, status = self._last_status
+            if time.monotonic() - fetched_at <= max_age:
+                return status
+
         response = self._request(
             "GET",
             f"/rest/db/status?folder={self.folder_id}"
         )
 
-        return FolderStatus(
+        status = FolderStatus(
             state=response.get("state", "unknown"),
             global_bytes=response.get("globalBytes", 0),
             local_bytes=response.get("localBytes", 0),
@@ -191,28 +309,43 @@ class SyncthingClient:
             errors=response.get("errors", 0),
             pull_errors=response.get("pullErrors", 0),
         )
+        self._last_status = (time.monotonic(), status)
+        return status
 
     def get_folder_config(self) -> dict[str, Any]:
-        """Get the folder configuration."""
+        """
+        Get the folder configuration.
+
+        Fetches only the managed folder, rather than listing every folder
+        Syncthing shares and searching for it.
+        """
         if not self.enabled:
             raise SyncthingError("Syncthing management is disabled")
 
-        response = self._request("GET", "/rest/config/folders")
-
-        for folder in response:
-            if folder.get("id") == self.folder_id:
-                return folder
-
-        raise SyncthingError(f"Folder '{self.folder_id}' not found in Syncthing config")
+        try:
+            return self._request("GET", f"/rest/config/folders/{self.folder_id}")
+        except SyncthingUnavailable:
+            raise
+        except SyncthingError as e:
+            # Syncthing answers 404 for a folder ID it doesn't know
+            raise SyncthingError(f"Folder '{self.folder_id}' not found in Syncthing config ({e})")
 
     def is_folder_paused(self) -> bool:
         """Check if the folder is currently paused."""
+        if self._paused_cache is not None:
+            known_at, paused = self._paused_cache
+            if time.monotonic() - known_at <= self.PAUSED_CACHE_TTL:
+                return paused
+
         try:
             folder_config = self.get_folder_config()
-            return folder_config.get("paused", False)
         except SyncthingError:
             return False
 
+        paused = folder_config.get("paused", False)
+        self._paused_cache = (time.monotonic(), paused)
+        return paused
+
     def pause_folder(self) -> bool:
         """
         Pause syncing for the managed folder.
@@ -225,25 +358,9 @@ class SyncthingClient:
             return False
 
         try:
-            # Get current folder config
-            folder_config = self.get_folder_config()
-
-            if folder_config.get("paused", False):
-                self.logger.debug("Folder already paused")
-                return True
-
-            # Update folder config to set paused=true
-            folder_config["paused"] = True
-
-            self._request(
-                "PUT",
-                f"/rest/config/folders/{self.folder_id}",
-                data=folder_config
-            )
-
+            self._set_paused(True)
             self.logger.info(f"Paused Syncthing folder: {self.folder_id}")
             return True
-
         except SyncthingError as e:
             self.logger.error(f"Failed to pause folder: {e}")
             return False
@@ -260,47 +377,153 @@ class SyncthingClient:
             return False
 
         try:
-            # Get current folder config
-            folder_config = self.get_folder_config()
+            self._set_paused(False)
+            self.logger.info(f"Resumed Syncthing folder: {self.folder_id}")
+            return True
+        except SyncthingError as e:
+            self.logger.error(f"Failed to resume folder: {e}")
+            return False
 
-            if not folder_config.get("paused", False):
-                self.logger.debug("Folder already resumed")
-                return True
+    def _set_paused(self, paused: bool) -> None:
+        """
+        Set the paused flag of the managed folder.
 
-            # Update folder config to set paused=false
-            folder_config["paused"] = False
+        Sends only the changed field with PATCH. Syncthing releases older
+        than 1.12 have no PATCH support; for those the full folder config
+        is read and written back instead.
 
-            self._request(
-                "PUT",
-                f"/rest/config/folders/{self.folder_id}",
-                data=folder_config
-            )
+        Args:
+            paused: Whether the folder should be paused
 
-            self.logger.info(f"Resumed Syncthing folder: {self.folder_id}")
-            return True
+        Raises:
+            SyncthingError: If the folder config cannot be updated
+        """
+        self._paused_cache = None
+        endpoint = f"/rest/config/folders/{self.folder_id}"
 
+        try:
+            self._request("PATCH", endpoint, data={"paused": paused})
+        except SyncthingUnavailable:
+            raise
         except SyncthingError as e:
-            self.logger.error(f"Failed to resume folder: {e}")
-            return False
+            self.logger.debug(f"PATCH of folder config failed ({e}), falling back to PUT")
+            folder_config = self.get_folder_config()
+            if folder_config.get("paused", False) != paused:
+                folder_config["paused"] = paused
+                self._request("PUT", endpoint, data=folder_config)
+
+        self._paused_cache = (time.monotonic(), paused)
+
+    def get_events(
+        self,
+        since: int,
+        timeout: int = 60,
+        limit: Optional[int] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Long-poll Syncthing's event stream for folder state changes.
+
+        Args:
+            since: Return only events with an ID greater than this
+            timeout: Seconds Syncthing may hold the request open waiting
+                for a new event
+            limit: Return at most this many (most recent) events
+
+        Returns:
+            List of events, empty if none arrived before the timeout
 
-    def wait_for_sync(self, timeout: int = 300, poll_interval: int = 5) -> bool:
+        Raises:
+            SyncthingError: If the events cannot be retrieved
+        """
+        endpoint = f"/rest/events?events={self.SYNC_EVENTS}&since={since}&timeout={timeout}"
+        if limit is not None:
+            endpoint += f"&limit={limit}"
+        # Allow for the long-poll itself on top of the usual request timeout
+        return self._request("GET", endpoint, timeout=timeout + 10) or []
+
+    def _wait_for_folder_event(
+        self, since: int, max_wait: float, stop: threading.Event
+    ) -> int:
+        """
+        Block until Syncthing reports a change to the managed folder.
+
+        Args:
+            since: ID of the last event already seen
+            max_wait: Maximum time to wait in seconds
+            stop: Event that ends the wait early once set
+
+        Returns:
+            ID of the last event seen
+        """
+        deadline = time.monotonic() + max_wait
+        while not stop.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            poll_timeout = max(1, min(self.EVENT_POLL_TIMEOUT, int(remaining)))
+            events = self.get_events(since, timeout=poll_timeout)
+            if events:
+                since = events[-1].get("id", since)
+            if any((event.get("data") or {}).get("folder") == self.folder_id for event in events):
+                break
+        return since
+
+    def wait_for_sync(
+        self,
+        timeout: int = 300,
+        poll_interval: int = 5,
+        stop: Optional[threading.Event] = None
+    ) -> bool:
         """
         Wait for folder to finish syncing.
 
+        Waits on Syncthing's event stream, re-checking the folder status
+        whenever the folder changes. If the event stream is unavailable it
+        falls back to checking every poll_interval seconds.
+
         Args:
             timeout: Maximum time to wait in seconds
-            poll_interval: Time between status checks in seconds
+            poll_interval: Time between status checks in seconds, when
+                polling
+            stop: Event that abandons the wait once set (e.g. on a signal)
 
         Returns:
-            True if synced, False if timeout or error
+            True if synced, False if timeout, error or stopped
         """
         if not self.enabled:
             return True
 
+        if stop is None:
+            stop = threading.Event()  # Never set
+
         self.logger.info("Waiting for Syncthing to finish syncing...")
-        start_time = time.time()
+        start_time = time.monotonic()
+
+        # The progress line redraws itself with \r, which is only useful
+        # on a terminal; it goes to the byte buffer in a single write
+        progress = sys.stdout.buffer if sys.stdout.isatty() else None
+        if progress is not None:
+            sys.stdout.flush()  # Keep earlier text output ahead of it
+
+        # Note the latest event before the first status check, so changes
+        # made after that check are still reported
+        last_event_id: Optional[int]
+        try:
+            events = self.get_events(0, timeout=1, limit=1)
+            last_event_id = events[-1].get("id", 0) if events else 0
+        except SyncthingError as e:
+            self.logger.debug(f"Event stream unavailable, polling instead: {e}")
+            last_event_id = None
+
+        while time.monotonic() - start_time < timeout:
+            if stop.is_set():
+                if progress is not None:
+                    progress.write(b"\n")
+                    progress.flush()
+                self.logger.info("Sync wait stopped")
+                return False
 
-        while time.time() - start_time < timeout:
             try:
                 status = self.get_folder_status()
 
@@ -312,20 +535,114 @@ class SyncthingClient:
                     self.logger.warning(f"Syncthing has errors: {status}")
                     return False
 
-                elapsed = int(time.time() - start_time)
+                elapsed = int(time.monotonic() - start_time)
                 self.logger.debug(f"Sync status: {status} (waited {elapsed}s)")
-                print(f"\r[mc-server] {status} (waited {elapsed}s)...", end="", flush=True)
-
-                time.sleep(poll_interval)
+                if progress is not None:
+                    progress.write(b"%s%s (waited %ds)..." % (PROGRESS_PREFIX, str(status).encode(), elapsed))
+                    progress.flush()
 
             except SyncthingError as e:
                 self.logger.error(f"Error checking sync status: {e}")
                 return False
 
-        print()  # Newline after progress
+            if last_event_id is None:
+                stop.wait(poll_interval)
+                continue
+
+            try:
+                last_event_id = self._wait_for_folder_event(
+                    last_event_id, timeout - (time.monotonic() - start_time), stop
+                )
+            except SyncthingError as e:
+                self.logger.debug(f"Event stream failed, polling instead: {e}")
+                last_event_id = None
+
+        if progress is not None:
+            progress.write(b"\n")  # Newline after progress
+            progress.flush()
         self.logger.warning(f"Sync wait timed out after {timeout}s")
         return False
 
+    def get_completion(self) -> dict[str, Any]:
+        """
+        Get the aggregated completion of the managed folder on remote devices.
+
+        Returns:
+            Completion response (completion percentage, needBytes, needItems)
+
+        Raises:
+            SyncthingError: If completion cannot be retrieved
+        """
+        return self._request("GET", f"/rest/db/completion?folder={self.folder_id}")
+
+    @functools.cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        """Worker thread for requests sent alongside another one."""
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix="syncthing")
+
+    def get_sync_state(self) -> tuple[FolderStatus, dict[str, Any]]:
+        """
+        Get the local folder status and the remote completion together.
+
+        The two requests are independent, so the completion is fetched on a
+        worker thread while the status is fetched here, costing one round
+        trip of latency instead of two.
+
+        Returns:
+            Tuple of (FolderStatus, completion response)
+
+        Raises:
+            SyncthingError: If either cannot be retrieved
+        """
+        completion = self._executor.submit(self.get_completion)
+        status = self.get_folder_status()
+        return status, completion.result()
+
+    def get_watcher_delay(self) -> Optional[float]:
+        """
+        Get how long the folder's filesystem watcher batches changes before scanning.
+
+        Returns:
+            fsWatcherDelayS in seconds, or None if the watcher is disabled or
+            the config cannot be read
+        """
+        try:
+            folder_config = self.get_folder_config()
+        except SyncthingError as e:
+            self.logger.debug(f"Could not read watcher delay: {e}")
+            return None
+
+        if not folder_config.get("fsWatcherEnabled", True):
+            return None
+        return float(folder_config.get("fsWatcherDelayS", 10))
+
+    def is_synced_with_remotes(self) -> bool:
+        """
+        Check if the folder is in sync both locally and on every remote device.
+
+        The local side must be idle with nothing needed, and the aggregated
+        completion of the remote devices must be 100%, meaning they have
+        received our latest changes.
+
+        Returns:
+            True if in sync everywhere, False otherwise (including on errors)
+        """
+        if not self.enabled:
+            return False
+
+        try:
+            status, completion = self.get_sync_state()
+        except SyncthingError as e:
+            self.logger.debug(f"Could not check remote completion: {e}")
+            return False
+
+        return (
+            status.is_synced
+            and completion.get("completion", 0) >= 100
+            and completion.get("needBytes", 1) == 0
+            and completion.get("needItems", 1) == 0
+        )
+
     def trigger_scan(self) -> bool:
         """
         Trigger a rescan of the folder.
@@ -4,8 +4,12 @@ Shared utilities for the Minecraft server wrapper.
 Provides logging setup, timestamp formatting, and common helpers.
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 import socket
 import stat
 from datetime import datetime, timezone
@@ -13,8 +17,9 @@ from pathlib import Path
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=1)
 def get_hostname() -> str:
-    """Get the current machine's hostname."""
+    """Get the current machine's hostname (looked up once per process)."""
     return socket.gethostname()
 
 
@@ -30,24 +35,34 @@ def get_backup_timestamp() -> str:
 
 def parse_timestamp(ts: str) -> datetime:
     """Parse an ISO format timestamp string to datetime."""
-    # Handle both with and without timezone
-    try:
-        return datetime.fromisoformat(ts)
-    except ValueError:
-        # Try parsing without timezone and assume UTC
-        return datetime.fromisoformat(ts.replace('Z', '+00:00'))
+    # fromisoformat only accepts a 'Z' UTC suffix from Python 3.11 on
+    if ts.endswith('Z'):
+        ts = ts[:-1] + '+00:00'
+    return datetime.fromisoformat(ts)
+
 
+def timestamp_age_seconds(ts: str, now: Optional[datetime] = None) -> float:
+    """
+    Get the age of a timestamp in seconds.
 
-def timestamp_age_seconds(ts: str) -> float:
-    """Get the age of a timestamp in seconds."""
+    Args:
+        ts: ISO format timestamp
+        now: Current UTC time, for callers aging many timestamps at once
+            (defaults to the time of the call)
+    """
     parsed = parse_timestamp(ts)
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
     # Ensure both are timezone-aware
     if parsed.tzinfo is None:
         parsed = parsed.replace(tzinfo=timezone.utc)
     return (now - parsed).total_seconds()
 
 
+# World-readable or world-writable
+_WORLD_ACCESS = stat.S_IROTH | stat.S_IWOTH
+
+
 def check_file_permissions(path: Path) -> tuple[bool, str]:
     """
     Check if a file has secure permissions (not world-readable).
@@ -55,18 +70,33 @@ def check_file_permissions(path: Path) -> tuple[bool, str]:
     Returns:
         Tuple of (is_secure, message)
     """
-    if not path.exists():
-        return True, "File does not exist"
-
     try:
-        mode = path.stat().st_mode
-        # Check if world-readable or world-writable
-        if mode & stat.S_IROTH or mode & stat.S_IWOTH:
-            return False, f"Warning: {path} is world-accessible (mode: {oct(mode)})"
-        return True, "Permissions OK"
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return True, "File does not exist"
     except OSError as e:
         return False, f"Could not check permissions: {e}"
 
+    if mode & _WORLD_ACCESS:
+        return False, f"Warning: {path} is world-accessible (mode: {oct(mode)})"
+    return True, "Permissions OK"
+
+
+# The wrapper's logger; logging.getLogger always returns this same object for
+# the name, so look it up once instead of on every get_logger() call
+_LOGGER = logging.getLogger("mc-server")
+
+# Writes queued log records to the real handlers; set by setup_logging
+_listener: Optional[logging.handlers.QueueListener] = None
+
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
 
 def setup_logging(
     log_file: Optional[Path] = None,
@@ -84,11 +114,19 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
-    logger = logging.getLogger("mc-server")
-    logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+    global _listener
+
+    logger = _LOGGER
+    logger.setLevel(_LOG_LEVELS.get(level.upper(), logging.INFO))
 
     # Clear any existing handlers
     logger.handlers.clear()
+    if _listener is not None:
+        _listener.stop()
+        atexit.unregister(_listener.stop)
+        _listener = None
+
+    handlers: list[logging.Handler] = []
 
     # Create formatter
     formatter = logging.Formatter(
@@ -101,7 +139,7 @@ def setup_logging(
         try:
             file_handler = logging.FileHandler(log_file, encoding='utf-8')
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except OSError as e:
             print(f"[mc-server] Warning: Could not create log file: {e}")
 
@@ -111,37 +149,47 @@ def setup_logging(
         console_handler.setFormatter(logging.Formatter("[mc-server] %(message)s"))
         # Only show INFO and above on console
         console_handler.setLevel(logging.INFO)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    # The handlers run on a listener thread, so logging from the server
+    # output and sync loops is a queue put rather than a blocking write.
+    # Records still queued at exit are written by the atexit stop().
+    if handlers:
+        log_queue: queue.Queue = queue.Queue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(_listener.stop)
 
     return logger
 
 
 def get_logger() -> logging.Logger:
     """Get the mc-server logger instance."""
-    return logging.getLogger("mc-server")
+    return _LOGGER
 
 
 def format_duration(seconds: float) -> str:
     """Format a duration in seconds to human-readable string."""
-    if seconds < 60:
-        return f"{int(seconds)}s"
-    elif seconds < 3600:
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{mins}m {secs}s"
-    else:
-        hours = int(seconds // 3600)
-        mins = int((seconds % 3600) // 60)
+    hours, rest = divmod(int(seconds), 3600)
+    mins, secs = divmod(rest, 60)
+    if hours:
         return f"{hours}h {mins}m"
+    if mins:
+        return f"{mins}m {secs}s"
+    return f"{secs}s"
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 
 def format_size(size_bytes: int) -> str:
     """Format a size in bytes to human-readable string."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
+    # Each unit is 2**10 times the last, so the bit length picks the unit
+    unit = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1) if size_bytes else 0
+    return f"{size_bytes / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
 
 
 def confirm_action(prompt: str, default: bool = False) -> bool:
@@ -217,17 +265,32 @@ class Colors:
     RESET = '\033[0m'
     BOLD = '\033[1m'
 
+    # Whether stdout is a TTY, and the check-list marks colored to match;
+    # set by refresh(), which runs at import
+    _enabled: bool
+    OK: str
+    FAIL: str
+    WARN: str
+
+    @classmethod
+    def refresh(cls) -> None:
+        """Re-check whether stdout is a TTY and recolor the check-list marks."""
+        cls._enabled = os.isatty(1)
+        cls.OK = cls.success('✓')
+        cls.FAIL = cls.error('✗')
+        cls.WARN = cls.warning('!')
+
     @classmethod
     def enabled(cls) -> bool:
-        """Check if colors should be enabled (TTY check)."""
-        return os.isatty(1)  # stdout is a TTY
+        """Check if colors should be enabled (stdout is a TTY)."""
+        return cls._enabled
 
     @classmethod
     def wrap(cls, text: str, color: str) -> str:
         """Wrap text in color codes if enabled."""
-        if cls.enabled():
-            return f"{color}{text}{cls.RESET}"
-        return text
+        if not cls._enabled:
+            return text
+        return f"{color}{text}{cls.RESET}"
 
     @classmethod
     def error(cls, text: str) -> str:
@@ -248,3 +311,8 @@ class Colors:
     def info(cls, text: str) -> str:
         """Format text as info (cyan)."""
         return cls.wrap(text, cls.CYAN)
+
+
+# stdout stays a TTY (or not) for the life of the process, so check it once
+# at import rather than with a syscall for every colored string
+Colors.refresh()
@@ -0,0 +1,65 @@
+"""
+Tests for backup archive creation.
+
+Run from the repository root with: python -m unittest discover tests
+"""
+
+import os
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+from lib import backup
+from lib.backup import BackupManager
+
+
+class CreateBackupRoundTripTest(unittest.TestCase):
+    """Archives written by create_backup() read back intact."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.world = root / "world"
+        self.backups = root / "backups"
+        self.backups.mkdir()
+
+        # Small text, incompressible bytes, a zlib-looking file and, with a
+        # lowered threshold, a streamed entry
+        self.files = {
+            "level.dat": b"\x1f\x8b" + os.urandom(6000),
+            "region/r.0.0.mca": os.urandom(20000),
+            "data/notes.txt": b"hello world\n" * 500,
+            "data/big.bin": b"abc" * 100000,
+            "data/empty": b"",
+        }
+        for name, data in self.files.items():
+            path = self.world / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _round_trip(self):
+        manager = BackupManager(self.backups, self.world, auto_prune=False, max_workers=2)
+        with mock.patch.object(backup, "STREAM_MIN_SIZE", 100000):
+            info = manager.create_backup()
+
+        with zipfile.ZipFile(info.path) as zf:
+            self.assertIsNone(zf.testzip())
+            contents = {name[len("world/"):]: zf.read(name) for name in zf.namelist()}
+        self.assertEqual(contents, self.files)
+
+    def test_raw_writes(self):
+        self.assertTrue(backup.ZIP_INTERNALS_OK)
+        self._round_trip()
+
+    def test_public_api_fallback(self):
+        with mock.patch.object(backup, "ZIP_INTERNALS_OK", False):
+            self._round_trip()
+
+
+if __name__ == "__main__":
+    unittest.main()